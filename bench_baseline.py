@@ -0,0 +1,48 @@
+import json
+import platform
+import sys
+
+
+def add_arguments(parser, baseline, threshold, repeat, what):
+    # The --save/--compare/--threshold/--repeat options every benchmark takes
+    parser.add_argument("--save", metavar="JSON", help=f"write results as a baseline, e.g. {baseline}")
+    parser.add_argument("--compare", metavar="JSON", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=threshold, help=f"allowed slowdown in percent (default {threshold:g})")
+    parser.add_argument("--repeat", type=int, default=repeat, help=f"{what} per benchmark; the fastest is kept")
+
+
+def compare(results, baseline, threshold, floor, unit, width):
+    # Returns the names of results slower than baseline by more than
+    # threshold %; slowdowns under `floor` units are treated as noise
+    regressions = []
+    for name, value in sorted(results.items()):
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:{width}s} {value:9.2f} {unit}   (new)")
+            continue
+        change = (value - base) / base * 100 if base else 0.0
+        flag = ""
+        if change > threshold and value - base > floor:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:{width}s} {value:9.2f} {unit}   {change:+6.1f}%{flag}")
+    return regressions
+
+
+def report(args, results, floor, unit, width, what):
+    # Saves, compares or prints results as the options ask; returns 1 if
+    # anything regressed
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(), "results": results}, f, indent=1, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold, floor, unit, width)
+        if regressions:
+            print(f"{len(regressions)} {what}(s) regressed more than {args.threshold}%", file=sys.stderr)
+            return 1
+        return 0
+    for name, value in sorted(results.items()):
+        print(f"{name:{width}s} {value:9.2f} {unit}")
+    return 0
@@ -0,0 +1,65 @@
+import argparse
+import subprocess
+import sys
+
+import bench_baseline
+
+BASELINE = "import_bench_baseline.json"
+
+# Modules batch workers and headless runs import, none of which may pull in
+# a GUI toolkit or the sound backends
+MODULES = [
+    "tetris", "tetris_engine", "tetris_sim", "tetris_replay", "tetris_ai",
+    "test", "ui", "slot_session", "slot_sim", "slot_server", "slot_bankroll",
+]
+FORBIDDEN = ["tkinter", "PyQt5", "tetris_audio", "tetris_window", "slot_window", "slot_reels"]
+
+
+def measure(module):
+    # Cumulative import time of `module` in microseconds, from a fresh
+    # interpreter, and any forbidden modules the import loaded
+    code = f"import sys, {module}; print(','.join(m for m in {FORBIDDEN!r} if m in sys.modules))"
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True)
+    if proc.returncode:
+        raise RuntimeError(f"importing {module} failed:\n{proc.stderr.strip().splitlines()[-1]}")
+    us = None
+    for line in proc.stderr.splitlines():
+        # "import time: self | cumulative | name"; top-level imports aren't indented
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].rstrip() == f" {module}":
+            us = int(parts[1])
+    loaded = [m for m in proc.stdout.strip().split(",") if m]
+    return us, loaded
+
+
+def run(repeat=5, modules=MODULES):
+    # Best of `repeat` fresh imports per module, in ms; and GUI leaks
+    results = {}
+    leaks = {}
+    for module in modules:
+        best = None
+        for _ in range(repeat):
+            us, loaded = measure(module)
+            best = us if best is None else min(best, us)
+        results[module] = best / 1000
+        if loaded:
+            leaks[module] = loaded
+    return results, leaks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import-time check for the headless entry points.")
+    bench_baseline.add_arguments(parser, BASELINE, threshold=25.0, repeat=5, what="imports")
+    parser.add_argument("--only", help="measure only this module")
+    args = parser.parse_args(argv)
+
+    results, leaks = run(args.repeat, [args.only] if args.only else MODULES)
+    for module, loaded in sorted(leaks.items()):
+        print(f"importing {module} loaded {', '.join(loaded)}", file=sys.stderr)
+    # Slowdowns under 2 ms are noise between fresh interpreters
+    status = bench_baseline.report(args, results, floor=2.0, unit="ms", width=16, what="import")
+    return 1 if leaks else status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
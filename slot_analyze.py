@@ -0,0 +1,111 @@
+import argparse
+import sys
+import time
+from fractions import Fraction
+
+import numpy as np
+
+from slot_paytable import SYMBOLS, TRIPLES, PAIRS, REELS, compile_paytable
+
+
+def reel_distribution(reel, symbols=SYMBOLS):
+    # A reel is either a strip (sequence of symbols, any length) or a
+    # {symbol: weight} mapping with any non-negative weights. Returns the
+    # weights in symbol ID order.
+    if isinstance(reel, dict):
+        weights = [reel.get(symbol, 0) for symbol in symbols]
+    else:
+        weights = [sum(1 for s in reel if s == symbol) for symbol in symbols]
+    if any(w < 0 for w in weights) or not sum(weights) > 0:
+        raise ValueError(f"reel weights must be non-negative with a positive total, got {weights}")
+    return weights
+
+
+def outcome_probabilities(reels, symbols=SYMBOLS):
+    # Probability of every outcome, in LUT order, as the product of the
+    # per-reel symbol probabilities: n ** 3 terms however long the strips are
+    weights = [np.array(reel_distribution(reel, symbols), dtype=np.float64) for reel in reels]
+    probs = [w / w.sum() for w in weights]
+    return np.einsum("i,j,k->ijk", *probs).ravel()
+
+
+def analyze(reels=None, paytable=None):
+    # Exact RTP, hit frequency and variance per unit bet. reels defaults to
+    # spin_row's three uniform reels.
+    paytable = paytable or compile_paytable()
+    reels = reels or [paytable.symbols] * REELS
+    probs = outcome_probabilities(reels, paytable.symbols)
+    lut = paytable.lut
+    rtp = float(probs @ lut)
+    return {
+        "rtp": rtp,
+        "hit_rate": float(probs[lut > 0].sum()),
+        "variance": float(probs @ (lut - rtp) ** 2),
+        "histogram": {float(v): float(probs[lut == v].sum()) for v in np.unique(lut)},
+    }
+
+
+def exact_rtp(reels=None, paytable=None):
+    # RTP as a Fraction, for checking the float results or publishing them
+    paytable = paytable or compile_paytable()
+    reels = reels or [paytable.symbols] * REELS
+    # Through str() so a weight like 0.1 counts as 1/10, not its binary value
+    weights = [[Fraction(str(w)) for w in reel_distribution(reel, paytable.symbols)] for reel in reels]
+    totals = [sum(w) for w in weights]
+    n = len(paytable.symbols)
+    rtp = Fraction(0)
+    for i, multiplier in enumerate(paytable.lut.tolist()):
+        if multiplier:
+            a, b, c = i // (n * n), i // n % n, i % n
+            rtp += weights[0][a] * weights[1][b] * weights[2][c] * Fraction(repr(multiplier))
+    return rtp / (totals[0] * totals[1] * totals[2])
+
+
+def _floats(text):
+    return [float(x) for x in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exact RTP, hit rate and variance of a slot paytable.")
+    parser.add_argument("--reel", action="append", type=_floats, metavar="W,W,W,W,W",
+                        help="symbol weights (strip counts) in the order " + " ".join(SYMBOLS)
+                        + "; give once for all reels or once per reel")
+    parser.add_argument("--triples", type=_floats, default=None, metavar="M,M,M,M,M", help="three-of-a-kind multipliers")
+    parser.add_argument("--pairs", type=_floats, default=None, metavar="M,M,M",
+                        help="pair multipliers for " + " ".join(symbol for symbol, _ in PAIRS))
+    args = parser.parse_args(argv)
+
+    reels = None
+    if args.reel:
+        if len(args.reel) not in (1, REELS):
+            parser.error(f"--reel must be given once or {REELS} times")
+        if any(len(w) != len(SYMBOLS) for w in args.reel):
+            parser.error(f"--reel takes {len(SYMBOLS)} weights")
+        reels = [dict(zip(SYMBOLS, w)) for w in (args.reel * REELS)[:REELS]]
+    if args.triples and len(args.triples) != len(TRIPLES):
+        parser.error(f"--triples takes {len(TRIPLES)} multipliers")
+    if args.pairs and len(args.pairs) != len(PAIRS):
+        parser.error(f"--pairs takes {len(PAIRS)} multipliers")
+    triples = dict(zip(TRIPLES, args.triples)) if args.triples else TRIPLES
+    pairs = list(zip((symbol for symbol, _ in PAIRS), args.pairs)) if args.pairs else PAIRS
+
+    start = time.perf_counter()
+    paytable = compile_paytable(SYMBOLS, triples, pairs)
+    try:
+        result = analyze(reels, paytable)
+    except ValueError as e:
+        parser.error(str(e))
+    elapsed = time.perf_counter() - start
+
+    print(f"RTP         {result['rtp']:.6f}")
+    print(f"            = {exact_rtp(reels, paytable)}")
+    print(f"hit rate    {result['hit_rate']:.6f}")
+    print(f"variance    {result['variance']:.6f}  (std dev {result['variance'] ** 0.5:.4f} bets)")
+    print("payout      probability")
+    for value, p in result["histogram"].items():
+        print(f"{value:6g}x     {p:.6%}")
+    print(f"analyzed in {elapsed * 1000:.2f} ms", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
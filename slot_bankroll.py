@@ -0,0 +1,96 @@
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from slot_paytable import PAYTABLE
+from slot_rng import SpinSource
+from slot_session import STARTING_BALANCE
+
+
+def flat(balance, last_bet, last_won, base, fraction):
+    return np.full(len(balance), base, dtype=np.int64)
+
+
+def martingale(balance, last_bet, last_won, base, fraction):
+    # Double the bet after a loss, back to the base bet after a win
+    return np.where(last_won | (last_bet == 0), base, last_bet * 2)
+
+
+def percent(balance, last_bet, last_won, base, fraction):
+    return np.maximum(1, (balance * fraction).astype(np.int64))
+
+
+STRATEGIES = {"flat": flat, "martingale": martingale, "percent": percent}
+
+
+def simulate(strategy, players=10000, base=10, fraction=0.02, target=None, max_spins=10000, seed=0, balance=STARTING_BALANCE):
+    # Plays `players` independent bankrolls in lockstep until each is ruined,
+    # reaches `target` or has made max_spins spins. Bets are whole numbers
+    # capped at the balance, and a balance under 1 is game over, as in
+    # SlotSession. Returns final balances, spins made, and ruined/won masks.
+    choose = STRATEGIES[strategy]
+    spins = SpinSource(seed)
+    lut = PAYTABLE.lut
+    balances = np.full(players, float(balance))
+    last_bet = np.zeros(players, dtype=np.int64)
+    last_won = np.zeros(players, dtype=bool)
+    counts = np.zeros(players, dtype=np.int64)
+    # Indexes of players still playing; finished players drop out of every
+    # array operation rather than being masked on each step
+    live = np.arange(players)
+    for _ in range(max_spins):
+        if not len(live):
+            break
+        held = balances[live]
+        bets = np.minimum(choose(held, last_bet[live], last_won[live], base, fraction), held.astype(np.int64))
+        payouts = bets * lut[PAYTABLE.index(spins.spins(len(live)))]
+        held += payouts - bets
+        balances[live] = held
+        last_bet[live] = bets
+        last_won[live] = payouts > 0
+        counts[live] += 1
+        done = held < 1
+        if target is not None:
+            done |= held >= target
+        live = live[~done]
+    ruined = balances < 1
+    won = ~ruined & (balances >= target) if target is not None else np.zeros(players, dtype=bool)
+    return balances, counts, ruined, won
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ruin odds and session lengths for slot betting strategies.")
+    parser.add_argument("--strategy", action="append", choices=sorted(STRATEGIES), help="repeatable; default: all")
+    parser.add_argument("--players", type=int, default=10000)
+    parser.add_argument("--bet", type=int, default=10, help="base bet for flat and martingale")
+    parser.add_argument("--fraction", type=float, default=0.02, help="share of the balance bet by percent")
+    parser.add_argument("--balance", type=int, default=STARTING_BALANCE, help="starting balance")
+    parser.add_argument("--target", type=float, default=None, help="players stop once their balance reaches this")
+    parser.add_argument("--max-spins", type=int, default=10000, help="players stop after this many spins")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for name in args.strategy or sorted(STRATEGIES):
+        start = time.perf_counter()
+        balances, counts, ruined, won = simulate(name, args.players, args.bet, args.fraction, args.target,
+                                                 args.max_spins, args.seed, args.balance)
+        elapsed = time.perf_counter() - start
+        lengths = np.percentile(counts, [10, 50, 90, 99])
+        print(f"{name}")
+        print(f"  ruined         {ruined.mean():8.2%}")
+        if args.target is not None:
+            print(f"  reached target {won.mean():8.2%}")
+        print(f"  still playing  {(~ruined & ~won).mean():8.2%}  after {args.max_spins} spins")
+        print(f"  session length mean {counts.mean():.0f}, p10 {lengths[0]:.0f}, p50 {lengths[1]:.0f}, "
+              f"p90 {lengths[2]:.0f}, p99 {lengths[3]:.0f} spins")
+        if ruined.any():
+            print(f"  spins to ruin  p50 {np.median(counts[ruined]):.0f}")
+        print(f"  final balance  mean {balances.mean():.1f}, p50 {np.median(balances):.1f}")
+        print(f"  {counts.sum():,} spins in {elapsed:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
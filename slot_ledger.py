@@ -0,0 +1,146 @@
+import argparse
+import os
+import struct
+import sys
+import threading
+import time
+
+import numpy as np
+
+LEDGER_FILE = "slot_ledger.bin"
+
+# Ledger layout: MAGIC and the record size, then one 48-byte record per spin:
+# the session's seed (low and high 64 bits), the spin's index in that seed's
+# stream, the three reel symbol IDs, the bet, and the payout and balance
+# after the spin. The seed and index are enough to redraw the reels.
+MAGIC = b"SLG1"
+HEADER = struct.Struct("<4sI")
+RECORD = struct.Struct("<QQQ3sxIdd")
+RECORD_DTYPE = np.dtype([
+    ("seed_lo", "<u8"), ("seed_hi", "<u8"), ("spin", "<u8"),
+    ("reels", "u1", (3,)), ("pad", "u1"), ("bet", "<u4"),
+    ("payout", "<f8"), ("balance", "<f8"),
+])
+assert RECORD_DTYPE.itemsize == RECORD.size
+MASK64 = (1 << 64) - 1
+
+
+class Ledger:
+    # Append-only spin ledger with group commit: records are packed into a
+    # buffer and written and fsynced together once `batch` are pending, or
+    # by a background thread once the oldest has waited `interval` seconds,
+    # so a lone spin is on disk within about `interval` even if no other
+    # spin follows it
+    def __init__(self, path=LEDGER_FILE, batch=256, interval=0.5, sync=True):
+        self.path = path
+        self.batch = batch
+        self.interval = interval
+        self.sync = sync
+        self.f = open(path, "ab", buffering=0)
+        if self.f.tell() == 0:
+            self.f.write(HEADER.pack(MAGIC, RECORD.size))
+        self.pending = bytearray()
+        self.count = 0
+        self.oldest = 0.0
+        self._lock = threading.Lock()
+        self._closing = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="slot-ledger", daemon=True)
+        self._thread.start()
+
+    def append(self, seed, spin):
+        record = RECORD.pack(seed & MASK64, seed >> 64 & MASK64, spin.index, bytes(spin.reels),
+                             spin.bet, spin.payout, spin.balance)
+        with self._lock:
+            if not self.count:
+                self.oldest = time.monotonic()
+            self.pending += record
+            self.count += 1
+            if self.count >= self.batch:
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        # Call with the lock held
+        if not self.count:
+            return
+        self.f.write(self.pending)
+        if self.sync:
+            os.fsync(self.f.fileno())
+        self.pending = bytearray()
+        self.count = 0
+
+    def _run(self):
+        while not self._closing.wait(self.interval / 4):
+            with self._lock:
+                if self.count and time.monotonic() - self.oldest >= self.interval:
+                    self._flush()
+
+    def close(self):
+        if self.f is not None:
+            self._closing.set()
+            self._thread.join()
+            self._flush()
+            self.f.close()
+            self.f = None
+
+
+def read_ledger(path=LEDGER_FILE):
+    # Memory-maps the records as a read-only structured array; a truncated
+    # tail record, e.g. from a crash mid-write, is ignored
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+    if len(header) < HEADER.size or HEADER.unpack(header) != (MAGIC, RECORD.size):
+        raise ValueError(f"{path}: not a slot ledger")
+    count = (os.path.getsize(path) - HEADER.size) // RECORD.size
+    if not count:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+
+
+def seeds(records):
+    return records["seed_lo"].astype(object) | records["seed_hi"].astype(object) << 64
+
+
+def verify(records):
+    # Redraws every spin's reels from its seed and reprices it; returns the
+    # indexes of records that don't match
+    from slot_paytable import PAYTABLE
+    from slot_rng import SpinSource
+
+    bad = []
+    keys = np.stack([records["seed_lo"], records["seed_hi"]], axis=1)
+    for key in np.unique(keys, axis=0):
+        rows = np.flatnonzero((keys == key).all(axis=1))
+        seed = int(key[0]) | int(key[1]) << 64
+        reels = SpinSource(seed).spins(int(records["spin"][rows].max()) + 1)[records["spin"][rows]]
+        ok = (reels == records["reels"][rows]).all(axis=1)
+        ok &= PAYTABLE.batch(reels, records["bet"][rows]) == records["payout"][rows]
+        bad.extend(rows[~ok].tolist())
+    return sorted(bad)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize or audit a slot ledger.")
+    parser.add_argument("path", nargs="?", default=LEDGER_FILE)
+    parser.add_argument("--verify", action="store_true", help="redraw and reprice every spin")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    records = read_ledger(args.path)
+    wagered = int(records["bet"].sum(dtype=np.int64))
+    paid = float(records["payout"].sum())
+    elapsed = time.perf_counter() - start
+    print(f"{len(records)} spins from {len(set(seeds(records).tolist()))} seed(s), "
+          f"wagered {wagered}, paid {paid:g} (RTP {paid / max(1, wagered):.4f}), read in {elapsed * 1000:.1f} ms")
+    if args.verify:
+        bad = verify(records)
+        print(f"{len(bad)} record(s) don't match their seed" + (f": {bad[:10]}" if bad else ""))
+        return 1 if bad else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
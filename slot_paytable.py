@@ -0,0 +1,149 @@
+import argparse
+import itertools
+import time
+from functools import lru_cache
+
+import numpy as np
+
+# Symbol IDs are indexes into this list
+SYMBOLS = ["🍒", "🍉", "🍋", "🔔", "⭐"]
+SYMBOL_IDS = {symbol: i for i, symbol in enumerate(SYMBOLS)}
+REELS = 3
+
+# The game's paytable; test.get_payout and every front end pay from it.
+# Three of a kind pays bet * multiplier
+TRIPLES = {"🍒": 4, "🍉": 6, "🍋": 8, "🔔": 12, "⭐": 20}
+# Two adjacent matching symbols pay the first of these found anywhere on the
+# row, in this order, even if it is not the matching pair
+PAIRS = (("🍒", 1.2), ("🍉", 1.5), ("🍋", 1.8))
+
+
+def _multiplier(row, triples, pairs):
+    # Same rules, in the same order, as _reference_payout
+    if row[0] == row[1] == row[2] and row[0] in triples:
+        return triples[row[0]]
+    if row[0] == row[1] or row[1] == row[2]:
+        for symbol, multiplier in pairs:
+            if symbol in row:
+                return multiplier
+    return 0
+
+
+class Paytable:
+    # A paytable compiled to a flat lookup table of multipliers, one entry
+    # per reel outcome, indexed by symbol IDs as a base-len(symbols) number
+    def __init__(self, symbols=SYMBOLS, triples=TRIPLES, pairs=PAIRS):
+        self.symbols = list(symbols)
+        self.ids = {symbol: i for i, symbol in enumerate(self.symbols)}
+        n = len(self.symbols)
+        triples, pairs = dict(triples), tuple(pairs)
+        self.lut = np.array([_multiplier(row, triples, pairs) for row in itertools.product(self.symbols, repeat=REELS)], dtype=np.float64)
+        # Row IDs dotted with this give the LUT index
+        self.place = n ** np.arange(REELS - 1, -1, -1)
+
+    def to_ids(self, rows):
+        # Symbol strings -> N x 3 int array
+        return np.array([[self.ids[symbol] for symbol in row] for row in rows], dtype=np.intp).reshape(-1, REELS)
+
+    def index(self, reels):
+        return np.asarray(reels) @ self.place
+
+    def payout(self, row, bet):
+        # One row of symbol strings; test.get_payout is this on PAYTABLE.
+        # Whole multipliers give an int result, as the original chain did
+        i = 0
+        for symbol in row:
+            i = i * len(self.symbols) + self.ids[symbol]
+        multiplier = self.lut[i].item()
+        return bet * (int(multiplier) if multiplier.is_integer() else multiplier)
+
+    def batch(self, reels, bets):
+        # reels: N x 3 symbol IDs; bets: scalar or N values. Returns N payouts.
+        return np.asarray(bets, dtype=np.float64) * self.lut[self.index(reels)]
+
+
+@lru_cache(maxsize=256)
+def _compiled(symbols, triples, pairs):
+    return Paytable(symbols, dict(triples), pairs)
+
+
+def compile_paytable(symbols=SYMBOLS, triples=TRIPLES, pairs=PAIRS):
+    # Paytables are cached by their rules, so tuning loops that revisit a
+    # paytable don't rebuild its table. Treat the result as read-only.
+    return _compiled(tuple(symbols), tuple(sorted(dict(triples).items())), tuple(tuple(p) for p in pairs))
+
+
+PAYTABLE = compile_paytable()
+
+
+def _reference_payout(row, bet):
+    # test.get_payout as it was written before the paytable was compiled;
+    # only the self-check below uses it, as the reference to compare with
+    if row[0] == row[1] == row[2] :
+        if row[0] == "🍒":
+            return bet * 4
+        elif row[0] == "🍉":
+            return bet * 6
+        elif row[0] == "🍋":
+            return bet * 8
+        elif row[0] == "🔔":
+            return bet * 12
+        elif row[0] == "⭐":
+            return bet * 20
+    # Check for two matching symbols (partial match)
+    if row[0] == row[1] or row[1] == row[2] :
+        if "🍒" in row:
+            return bet * 1.2
+        elif "🍉" in row:
+            return bet * 1.5
+        elif "🍋" in row:
+            return bet * 1.8
+        # elif "🔔" in row:
+        #     return bet * 3
+        # elif "⭐" in row:
+        #     return bet * 3.5
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the compiled paytable against the original payout rules and time both.")
+    parser.add_argument("--spins", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rows = list(itertools.product(SYMBOLS, repeat=REELS))
+    reels = PAYTABLE.to_ids(rows)
+    for bet in (1, 3, 7, 10, 999):
+        expected = [_reference_payout(list(row), bet) for row in rows]
+        got = PAYTABLE.batch(reels, bet).tolist()
+        bad = [row for row, e, g in zip(rows, expected, got) if e != g]
+        # payout() must match the reference's type too, int for whole multipliers
+        for row, e in zip(rows, expected):
+            g = PAYTABLE.payout(row, bet)
+            if g != e or type(g) is not type(e):
+                bad.append(row)
+        if bad:
+            print(f"mismatch at bet {bet}: {bad[:5]}")
+            return 1
+    print(f"all {len(rows)} outcomes match the reference rules")
+
+    rng = np.random.default_rng(args.seed)
+    reels = rng.integers(0, len(SYMBOLS), size=(args.spins, REELS))
+    bets = rng.integers(1, 101, size=args.spins)
+    start = time.perf_counter()
+    total = PAYTABLE.batch(reels, bets).sum()
+    batch_time = time.perf_counter() - start
+
+    sample = min(args.spins, 200_000)
+    symbol_rows = [[SYMBOLS[i] for i in row] for row in reels[:sample].tolist()]
+    sample_bets = bets[:sample].tolist()
+    start = time.perf_counter()
+    for row, bet in zip(symbol_rows, sample_bets):
+        _reference_payout(row, bet)
+    scalar_time = (time.perf_counter() - start) * args.spins / sample
+    print(f"{args.spins} spins: batch {batch_time * 1000:.1f} ms, if/elif chain ~{scalar_time * 1000:.0f} ms, total paid {total:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+import math
+import time
+
+from PyQt5.QtCore import Qt, QTimer, QRectF, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QPainter, QPen, QPixmap
+from PyQt5.QtWidgets import QWidget
+
+from slot_paytable import SYMBOLS, REELS
+
+FPS = 60
+SPEED = 14.0  # symbols per second while a reel spins freely
+SLOWDOWN = 0.6  # shortest time a reel takes to come to rest, in seconds
+STAGGER = 0.25  # seconds between one reel and the next starting to stop
+
+_atlases = {}
+
+
+def symbol_atlas(symbols, cell, ratio=1.0):
+    # Every symbol rendered once into one column of cell x cell tiles.
+    # Shaping colour emoji is the expensive part, so it is never redone.
+    key = (tuple(symbols), cell, ratio)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        size = round(cell * ratio)
+        atlas = QPixmap(size, size * len(symbols))
+        atlas.fill(Qt.transparent)
+        painter = QPainter(atlas)
+        font = QFont()
+        font.setPixelSize(int(size * 0.7))
+        painter.setFont(font)
+        for i, symbol in enumerate(symbols):
+            painter.drawText(QRectF(0, i * size, size, size), Qt.AlignCenter, symbol)
+        painter.end()
+        atlas.setDevicePixelRatio(ratio)
+        _atlases[key] = atlas
+    return atlas
+
+
+class _Reel:
+    # Position is measured in symbols along the strip; a whole number n means
+    # symbol n % len(symbols) sits on the payline
+    __slots__ = ("start", "start_pos", "land_at", "land_pos", "target", "duration")
+
+    def __init__(self, pos=0.0):
+        self.rest(pos)
+
+    def rest(self, pos):
+        self.start = self.land_at = 0.0
+        self.start_pos = self.land_pos = self.target = pos
+        self.duration = 0.0
+
+    def spin(self, now):
+        self.start_pos = self.position(now)
+        self.start = now
+        self.land_at = math.inf
+
+    def stop(self, at, symbol, count):
+        # Decelerate evenly from full speed, starting at `at`, to rest on the
+        # first copy of `symbol` that is at least SLOWDOWN's distance away
+        self.land_at = at
+        self.land_pos = self.start_pos + SPEED * (at - self.start)
+        least = self.land_pos + SPEED * SLOWDOWN / 2
+        self.target = math.ceil((least - symbol) / count) * count + symbol
+        self.duration = 2 * (self.target - self.land_pos) / SPEED
+
+    def position(self, now):
+        if now < self.land_at:
+            return self.start_pos + SPEED * (now - self.start)
+        t = now - self.land_at
+        if t >= self.duration:
+            return self.target
+        return self.land_pos + SPEED * t - SPEED * t * t / (2 * self.duration)
+
+    def done(self, now):
+        return now >= self.land_at + self.duration
+
+
+class ReelStrip(QWidget):
+    # The reels as scrolling strips, painted from the symbol atlas. The
+    # timer only runs while a reel is moving, and every frame is placed by
+    # the clock rather than by counting ticks, so late frames don't stutter.
+    landed = pyqtSignal()
+
+    def __init__(self, symbols=SYMBOLS, cell=64, parent=None):
+        super().__init__(parent)
+        self.symbols = list(symbols)
+        self.cell = cell
+        self.gap = 8
+        self.reels = [_Reel() for _ in range(REELS)]
+        self.setFixedSize(REELS * cell + (REELS + 1) * self.gap, int(cell * 1.8))
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(1000 // FPS)
+        self.timer.timeout.connect(self._tick)
+
+    def show_row(self, ids):
+        # Put the reels at rest on these symbol IDs
+        self.timer.stop()
+        for reel, symbol in zip(self.reels, ids):
+            reel.rest(float(symbol))
+        self.update()
+
+    def spin(self):
+        now = time.monotonic()
+        for reel in self.reels:
+            reel.spin(now)
+        self.timer.start()
+
+    def stop(self, ids):
+        # Land the reels, left to right, on this row of symbol IDs
+        now = time.monotonic()
+        for i, (reel, symbol) in enumerate(zip(self.reels, ids)):
+            reel.stop(now + i * STAGGER, symbol, len(self.symbols))
+
+    def _tick(self):
+        self.update()
+        if all(reel.done(time.monotonic()) for reel in self.reels):
+            self.timer.stop()
+            self.landed.emit()
+
+    def paintEvent(self, event):
+        now = time.monotonic()
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.palette().window())
+        atlas = symbol_atlas(self.symbols, self.cell, self.devicePixelRatioF())
+        size = atlas.width()
+        cell, h, n = self.cell, self.height(), len(self.symbols)
+        reach = h / (2 * cell) + 0.5
+        for i, reel in enumerate(self.reels):
+            pos = reel.position(now)
+            x = self.gap + i * (cell + self.gap)
+            painter.setClipRect(x, 0, cell, h)
+            painter.fillRect(x, 0, cell, h, Qt.white)
+            # Higher positions sit above, so the strip scrolls downwards
+            for j in range(math.ceil(pos - reach), math.floor(pos + reach) + 1):
+                y = h / 2 - (j - pos) * cell - cell / 2
+                painter.drawPixmap(QRectF(x, y, cell, cell), atlas, QRectF(0, (j % n) * size, size, size))
+        painter.setClipping(False)
+        painter.setPen(QPen(QColor("#c33"), 2))
+        painter.drawLine(0, h // 2, self.width(), h // 2)
+        painter.end()
@@ -0,0 +1,72 @@
+import numpy as np
+
+from slot_paytable import SYMBOLS, REELS
+
+BLOCK = 4096  # spins drawn from the generator at a time
+
+
+class SpinSource:
+    # Reproducible stream of reel results. Rows are drawn from a NumPy
+    # Generator a block at a time and handed out one by one or in bulk; the
+    # stream is the same however it is consumed, because the generator is
+    # only ever asked for one whole block at a time.
+    def __init__(self, seed=None, symbols=SYMBOLS, block=BLOCK):
+        self.seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        # Entropy is recorded so a session started without a seed can be replayed
+        self.seed = self.seq.entropy
+        self.symbols = list(symbols)
+        self.block = block
+        self.rng = np.random.default_rng(self.seq)
+        self._ids = np.empty((0, REELS), dtype=np.uint8)
+        self._rows = []
+        self._pos = 0
+        self.spun = 0
+
+    def spawn(self):
+        # An independent stream, e.g. for another player or for cosmetics.
+        # The child gets a plain 128-bit seed derived from this stream's
+        # seed, so its .seed alone replays it (a spawned SeedSequence would
+        # carry the parent's entropy plus a spawn key .seed can't hold).
+        child = self.seq.spawn(1)[0]
+        seed = int.from_bytes(child.generate_state(4, np.uint32).tobytes(), "little")
+        return SpinSource(seed, self.symbols, self.block)
+
+    def _draw(self):
+        # Always exactly one block: bounded draws from a Generator are not
+        # split-invariant, so one call of 2 blocks != two calls of 1
+        return self.rng.integers(0, len(self.symbols), size=(self.block, REELS), dtype=np.uint8)
+
+    def _refill(self):
+        self._ids = self._draw()
+        self._rows = self._ids.tolist()
+        self._pos = 0
+
+    def spin_ids(self):
+        # One row of symbol IDs
+        if self._pos == len(self._rows):
+            self._refill()
+        row = self._rows[self._pos]
+        self._pos += 1
+        self.spun += 1
+        return row
+
+    def spin(self):
+        # One row of symbols, like test.spin_row
+        symbols = self.symbols
+        return [symbols[i] for i in self.spin_ids()]
+
+    def spins(self, n):
+        # n x 3 array of symbol IDs
+        rest = self._ids[self._pos:self._pos + n]
+        self._pos += len(rest)
+        self.spun += n
+        short = n - len(rest)
+        if not short:
+            return rest
+        blocks = -(-short // self.block)
+        fresh = np.concatenate([self._draw() for _ in range(blocks)])
+        # Keep the unused tail of the last block for later spins
+        self._ids = fresh[-self.block:]
+        self._rows = self._ids.tolist()
+        self._pos = short - (blocks - 1) * self.block
+        return np.concatenate([rest, fresh[:short]])
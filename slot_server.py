@@ -0,0 +1,226 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import sys
+import time
+
+import numpy as np
+
+from slot_ledger import Ledger
+from slot_paytable import PAYTABLE
+from slot_rng import SpinSource
+from slot_session import SlotSession
+
+HOST = "127.0.0.1"
+PORT = 8765
+
+# Protocol: one JSON object per line each way. Requests are
+#   {"op": "join", "player": NAME}   -> {"ok": true, "balance": B}
+#   {"op": "spin", "bet": N}         -> {"ok": true, "reels": [...], "payout": P, "balance": B}
+#   {"op": "balance"}                -> {"ok": true, "balance": B}
+#   {"op": "reset"}                  -> {"ok": true, "balance": B}
+# and failures are {"ok": false, "error": MESSAGE}. An "id" in a request is
+# echoed in its response.
+
+
+class SlotServer:
+    # Many players, one process. Each player has a SlotSession; spins from
+    # every connection are queued and settled together once per event loop
+    # pass, with one bulk draw from the spin stream and one NumPy payout pass.
+    def __init__(self, seed=None, ledger=None):
+        self.spins = SpinSource(seed)
+        self.ledger = ledger
+        self.players = {}
+        self.pending = []
+        self.flush_scheduled = False
+        self.batches = 0
+        self.settled = 0
+
+    def player(self, name):
+        session = self.players.get(name)
+        if session is None:
+            session = self.players[name] = SlotSession(spins=self.spins, ledger=self.ledger)
+        return session
+
+    def spin(self, session, bet):
+        # Future of the spin's response, settled with the rest of this pass
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((session, bet, future))
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush)
+        return future
+
+    def _flush(self):
+        pending, self.pending = self.pending, []
+        self.flush_scheduled = False
+        # Check bets in arrival order, holding back what earlier spins in
+        # this batch have staked, so one player on two connections can't
+        # overdraw
+        accepted = []
+        staked = {}
+        for session, bet, future in pending:
+            held = staked.get(id(session), 0)
+            error = session.bet_error(bet, session.balance - held)
+            if error:
+                future.set_result({"ok": False, "error": error})
+            else:
+                staked[id(session)] = held + bet
+                accepted.append((session, bet, future))
+        if not accepted:
+            return
+        first = self.spins.spun
+        reels = self.spins.spins(len(accepted))
+        bets = np.array([bet for _, bet, _ in accepted], dtype=np.int64)
+        payouts = PAYTABLE.batch(reels, bets).tolist()
+        symbols = self.spins.symbols
+        for i, ((session, bet, future), row, payout) in enumerate(zip(accepted, reels.tolist(), payouts)):
+            # Whole payouts as ints, like get_payout
+            payout = int(payout) if payout.is_integer() else payout
+            spin = session.settle(first + i, row, bet, payout)
+            if not future.done():
+                future.set_result({"ok": True, "reels": [symbols[s] for s in row], "payout": payout, "balance": spin.balance})
+        self.batches += 1
+        self.settled += len(accepted)
+
+    async def handle(self, reader, writer):
+        session = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    op = request["op"]
+                except (ValueError, KeyError, TypeError):
+                    response = {"ok": False, "error": "Bad request."}
+                else:
+                    if op == "join":
+                        session = self.player(str(request.get("player", "")))
+                        response = {"ok": True, "balance": session.balance}
+                    elif session is None:
+                        response = {"ok": False, "error": "Join first."}
+                    elif op == "spin":
+                        bet = request.get("bet")
+                        if isinstance(bet, int) and not isinstance(bet, bool):
+                            response = await self.spin(session, bet)
+                        else:
+                            response = {"ok": False, "error": "Enter a valid bet amount."}
+                    elif op == "balance":
+                        response = {"ok": True, "balance": session.balance}
+                    elif op == "reset":
+                        session.reset()
+                        response = {"ok": True, "balance": session.balance}
+                    else:
+                        response = {"ok": False, "error": f"Unknown op {op!r}."}
+                    if "id" in request:
+                        response["id"] = request["id"]
+                writer.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host=HOST, port=PORT, ready=None):
+        server = await asyncio.start_server(self.handle, host, port)
+        if ready is not None:
+            ready.set()
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        if self.ledger is not None:
+            self.ledger.close()
+
+
+def run_server(host=HOST, port=PORT, seed=None, ledger_path=None, ready=None):
+    server = SlotServer(seed, Ledger(ledger_path) if ledger_path else None)
+    try:
+        asyncio.run(server.serve(host, port, ready))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+async def _client(host, port, name, bet, deadline, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+
+    async def call(request):
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    await call({"op": "join", "player": name})
+    spin = {"op": "spin", "bet": bet}
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = await call(spin)
+        latencies.append(time.perf_counter() - start)
+        if not response["ok"] or response["balance"] < bet:
+            await call({"op": "reset"})
+    writer.close()
+
+
+async def load(host=HOST, port=PORT, clients=100, duration=5.0, bet=1):
+    # Each client keeps one spin in flight for `duration` seconds;
+    # returns every spin's round-trip latency in seconds
+    latencies = []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(_client(host, port, f"load-{i}", bet, deadline, latencies) for i in range(clients)))
+    return latencies
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-player slot server and a local load generator.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="run the server")
+    serve.add_argument("--seed", type=int, default=None)
+    serve.add_argument("--ledger", default=None, help="append every spin to this ledger file")
+    bench = commands.add_parser("load", help="run the load generator; starts a local server unless --no-server")
+    bench.add_argument("--clients", type=int, default=100)
+    bench.add_argument("--duration", type=float, default=5.0, help="seconds")
+    bench.add_argument("--bet", type=int, default=1)
+    bench.add_argument("--no-server", action="store_true", help="use a server that is already running")
+    for command in (serve, bench):
+        command.add_argument("--host", default=HOST)
+        command.add_argument("--port", type=int, default=PORT)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        print(f"serving on {args.host}:{args.port}", file=sys.stderr)
+        run_server(args.host, args.port, args.seed, args.ledger)
+        return 0
+
+    process = None
+    if not args.no_server:
+        # The server gets its own process so clients don't steal its loop
+        ready = multiprocessing.Event()
+        process = multiprocessing.Process(target=run_server, args=(args.host, args.port, 0, None, ready), daemon=True)
+        process.start()
+        if not ready.wait(10):
+            print("server did not start", file=sys.stderr)
+            return 1
+    try:
+        latencies = asyncio.run(load(args.host, args.port, args.clients, args.duration, args.bet))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.join()
+    latencies.sort()
+    n = len(latencies)
+    if not n:
+        print("no spins completed", file=sys.stderr)
+        return 1
+    p50 = latencies[n // 2] * 1000
+    p99 = latencies[min(n - 1, int(n * 0.99))] * 1000
+    print(f"{n} spins from {args.clients} clients in {args.duration:g}s: {n / args.duration:,.0f} req/s, "
+          f"p50 {p50:.2f} ms, p99 {p99:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
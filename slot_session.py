@@ -0,0 +1,92 @@
+from collections import namedtuple
+
+from slot_paytable import PAYTABLE
+from slot_rng import SpinSource
+
+STARTING_BALANCE = 1000
+
+# index is the spin's position in the session's SpinSource stream
+Spin = namedtuple("Spin", "index reels symbols bet payout balance")
+
+
+class SlotSession:
+    # Balance, bet rules and payouts for one player, with no GUI. The Qt and
+    # terminal front ends both play through this, and every spin is appended
+    # to the ledger when there is one.
+    def __init__(self, balance=STARTING_BALANCE, spins=None, paytable=PAYTABLE, ledger=None):
+        self.starting_balance = balance
+        self.spins = spins or SpinSource()
+        self.paytable = paytable
+        self.ledger = ledger
+        self.reset()
+
+    def reset(self):
+        # A fresh balance; the spin stream carries on where it was
+        self.balance = self.starting_balance
+        self.spin_count = 0
+        self.total_wins = 0
+        self.total_losses = 0
+
+    @property
+    def game_over(self):
+        # Bets are whole numbers, so a balance under 1 can't be played
+        return self.balance < 1
+
+    def bet_error(self, bet, available=None):
+        # Why a bet (int or the text the player typed) can't be placed, or
+        # None. `available` is what the bet may use, the balance by default.
+        if isinstance(bet, str):
+            if not bet.isdigit():
+                return "Enter a valid bet amount."
+            bet = int(bet)
+        if bet <= 0:
+            return "Bet must be greater than 0."
+        if bet > (self.balance if available is None else available):
+            return "Insufficient balance."
+        return None
+
+    def spin(self, bet):
+        error = self.bet_error(bet)
+        if error:
+            raise ValueError(error)
+        bet = int(bet)
+        index = self.spins.spun
+        reels = self.spins.spin_ids()
+        payout = self.paytable.payout([self.spins.symbols[i] for i in reels], bet)
+        return self.settle(index, reels, bet, payout)
+
+    def settle(self, index, reels, bet, payout):
+        # Applies a spin drawn and priced elsewhere, e.g. in a batch; the bet
+        # must already have passed bet_error
+        symbols = [self.spins.symbols[i] for i in reels]
+        self.balance += payout - bet
+        self.spin_count += 1
+        if payout > 0:
+            self.total_wins += 1
+        else:
+            self.total_losses += 1
+        spin = Spin(index, reels, symbols, bet, payout, self.balance)
+        if self.ledger is not None:
+            self.ledger.append(self.spins.seed, spin)
+        return spin
+
+    def close(self):
+        if self.ledger is not None:
+            self.ledger.close()
+
+
+def play_headless(seed=None, bet=10, spins=100, ledger=None):
+    # Flat bets with no window or prompts until `spins` spins are made or the
+    # balance runs out; returns the session
+    session = SlotSession(spins=SpinSource(seed), ledger=ledger)
+    try:
+        while session.spin_count < spins and not session.game_over:
+            session.spin(min(bet, int(session.balance)))
+    finally:
+        session.close()
+    return session
+
+
+def headless_summary(session):
+    return (f"seed {session.spins.seed}: {session.spin_count} spins, {session.total_wins} wins, "
+            f"{session.total_losses} losses, balance {session.balance:g}")
@@ -0,0 +1,120 @@
+import argparse
+import os
+import sys
+import time
+from multiprocessing import Pool
+from statistics import NormalDist
+
+import numpy as np
+
+from slot_paytable import PAYTABLE
+from slot_rng import SpinSource
+
+OUTCOMES = len(PAYTABLE.lut)
+
+
+def run_chunk(seed, chunk, spins):
+    # Spins one chunk with its own stream and returns how often each reel
+    # outcome came up; everything else is derived from these counts, so a
+    # chunk sends 125 integers back instead of its payouts
+    reels = SpinSource(np.random.SeedSequence([seed, chunk])).spins(spins)
+    return np.bincount(PAYTABLE.index(reels), minlength=OUTCOMES)
+
+
+def _run_args(args):
+    return run_chunk(*args)
+
+
+def run_chunks(seed, spins, chunk_size, workers=None):
+    # Yields outcome counts per chunk as chunks finish; closing the generator
+    # stops the pool
+    jobs = ((seed, i, min(chunk_size, spins - start)) for i, start in enumerate(range(0, spins, chunk_size)))
+    if workers == 1:
+        for job in jobs:
+            yield _run_args(job)
+        return
+    with Pool(workers or os.cpu_count() or 1) as pool:
+        yield from pool.imap_unordered(_run_args, jobs)
+
+
+class Stats:
+    # Running totals over per-outcome counts, in units of the bet
+    def __init__(self, lut=PAYTABLE.lut):
+        self.lut = lut
+        self.counts = np.zeros(len(lut), dtype=np.int64)
+
+    def add(self, counts):
+        self.counts += counts
+
+    @property
+    def spins(self):
+        return int(self.counts.sum())
+
+    def rtp(self):
+        return float(self.counts @ self.lut) / max(1, self.spins)
+
+    def hit_rate(self):
+        return float(self.counts[self.lut > 0].sum()) / max(1, self.spins)
+
+    def variance(self):
+        n = self.spins
+        if n < 2:
+            return 0.0
+        mean = self.rtp()
+        return (float(self.counts @ (self.lut - mean) ** 2)) / (n - 1)
+
+    def half_width(self, confidence):
+        # Half-width of the normal confidence interval on the RTP
+        if self.spins < 2:
+            return float("inf")
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        return z * (self.variance() / self.spins) ** 0.5
+
+    def histogram(self):
+        # {payout multiplier: spins}
+        values, where = np.unique(self.lut, return_inverse=True)
+        totals = np.bincount(where, weights=self.counts, minlength=len(values))
+        return {float(v): int(t) for v, t in zip(values, totals)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo RTP and volatility of the slot machine.")
+    parser.add_argument("--spins", type=int, default=100_000_000, help="maximum spins to simulate")
+    parser.add_argument("--chunk", type=int, default=1_000_000, help="spins per seeded chunk")
+    parser.add_argument("--seed", type=int, default=0, help="chunk i is seeded with (seed, i)")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use (default: all cores)")
+    parser.add_argument("--target", type=float, default=None, help="stop once the RTP confidence interval is this narrow (+/-)")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--every", type=float, default=1.0, help="seconds between progress lines")
+    args = parser.parse_args(argv)
+
+    stats = Stats()
+    start = last = time.perf_counter()
+    chunks = run_chunks(args.seed, args.spins, args.chunk, args.workers)
+    try:
+        for counts in chunks:
+            stats.add(counts)
+            now = time.perf_counter()
+            done = args.target is not None and stats.half_width(args.confidence) <= args.target
+            if now - last >= args.every or done:
+                last = now
+                print(f"{stats.spins:>13,} spins  RTP {stats.rtp():.5f} +/- {stats.half_width(args.confidence):.5f}"
+                      f"  hit {stats.hit_rate():.4f}  var {stats.variance():.4f}", file=sys.stderr)
+            if done:
+                break
+    finally:
+        chunks.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"spins       {stats.spins}")
+    print(f"RTP         {stats.rtp():.6f} +/- {stats.half_width(args.confidence):.6f} ({args.confidence:.0%})")
+    print(f"hit rate    {stats.hit_rate():.6f}")
+    print(f"variance    {stats.variance():.6f}  (std dev {stats.variance() ** 0.5:.4f} bets)")
+    print("payout      spins")
+    for value, count in stats.histogram().items():
+        print(f"{value:6g}x     {count} ({count / max(1, stats.spins):.4%})")
+    print(f"{stats.spins / elapsed:,.0f} spins/s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
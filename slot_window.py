@@ -0,0 +1,146 @@
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout,QLineEdit
+from PyQt5.QtCore import QTimer
+from slot_rng import SpinSource
+from slot_session import SlotSession
+from slot_ledger import Ledger, LEDGER_FILE
+from slot_reels import ReelStrip
+
+class SlotMachine(QWidget):
+    def __init__(self, seed=None):
+        super().__init__()
+        self.setWindowTitle("Slot Machine")
+        self.setFixedSize(350, 360)
+
+        # Game state; results come from a seeded stream so a session can be
+        # replayed, and every spin goes to the ledger
+        self.spins = SpinSource(seed)
+        self.session = SlotSession(spins=self.spins, ledger=Ledger(LEDGER_FILE))
+        self.balance = self.session.balance
+
+        # Layouts
+        main_layout = QVBoxLayout()
+        self.setLayout(main_layout)
+
+        # Balance display
+        self.balance_label = QLabel(f"Balance: ${self.balance}", self)
+        self.balance_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        main_layout.addWidget(self.balance_label)
+
+        # Stats display
+        self.stats_label = QLabel(self)
+        self.stats_label.setStyleSheet("font-size: 14px; color: #555;")
+        self.update_stats()
+        main_layout.addWidget(self.stats_label)
+
+        # Bet input
+        bet_layout = QHBoxLayout()
+        bet_label = QLabel("Bet:", self)
+        bet_label.setStyleSheet("font-size: 16px;")
+        self.bet_input = QLineEdit(self)
+        self.bet_input.setPlaceholderText("Enter bet amount")
+        self.bet_input.setFixedWidth(150)
+        bet_layout.addWidget(bet_label)
+        bet_layout.addWidget(self.bet_input)
+        main_layout.addLayout(bet_layout)
+
+        # Slot symbols
+        self.slots_layout = QHBoxLayout()
+        self.reels = ReelStrip(self.spins.symbols, parent=self)
+        self.reels.landed.connect(self.show_result)
+        self.slots_layout.addWidget(self.reels)
+        main_layout.addLayout(self.slots_layout)
+
+
+        # Spin and Reset buttons
+        button_layout = QHBoxLayout()
+        self.button = QPushButton("Spin")
+        self.button.setStyleSheet("font-weight: bold; font-size: 20px;")
+        self.button.clicked.connect(self.start_spin)
+        button_layout.addWidget(self.button)
+
+        self.reset_button = QPushButton("Reset Game")
+        self.reset_button.setStyleSheet("font-size: 14px;")
+        self.reset_button.clicked.connect(self.reset_game)
+        button_layout.addWidget(self.reset_button)
+        main_layout.addLayout(button_layout)
+
+
+        # Last spin result label
+        self.last_spin_label = QLabel("", self)
+        self.last_spin_label.setStyleSheet("font-size: 18px; color: #333;")
+        main_layout.addWidget(self.last_spin_label)
+
+        # Message label
+        self.message_label = QLabel("", self)
+        self.message_label.setStyleSheet("font-size: 16px; color: green;")
+        main_layout.addWidget(self.message_label)
+
+        # Timers
+        self.duration_timer = QTimer()
+        self.duration_timer.setSingleShot(True)
+        self.duration_timer.timeout.connect(self.stop_spin)
+
+    def start_spin(self):
+        bet_text = self.bet_input.text()
+        error = self.session.bet_error(bet_text)
+        if error:
+            self.message_label.setText(error)
+            return
+        # The outcome is settled now; the reels just reveal it
+        self.spin = self.session.spin(int(bet_text))
+        self.balance = self.spin.balance - self.spin.payout
+        self.update_balance()
+        self.message_label.setText("")
+        self.button.setDisabled(True)
+        self.bet_input.setDisabled(True)
+        self.reels.spin()
+        self.duration_timer.start(1000)  # spin freely for 1 second, then land
+
+        # Clear last spin result
+        self.last_spin_label.setText("")
+
+    def stop_spin(self):
+        # The reels slow down and land on the spin's result
+        self.reels.stop(self.spin.reels)
+
+    def show_result(self):
+        payout = self.spin.payout
+        self.balance = self.spin.balance
+        if payout > 0:
+            self.message_label.setStyleSheet("font-size: 16px; color: green;")
+            self.message_label.setText(f"You win: ${payout}")
+        else:
+            self.message_label.setStyleSheet("font-size: 16px; color: red;")
+            self.message_label.setText("You lose!")
+        self.update_balance()
+        self.update_stats()
+        self.button.setDisabled(False)
+        self.bet_input.setDisabled(False)
+        if self.session.game_over:
+            self.message_label.setText("Game Over! No balance left.")
+            self.button.setDisabled(True)
+            self.bet_input.setDisabled(True)
+
+    def update_balance(self):
+        self.balance_label.setText(f"Balance: ${self.balance}")
+
+    def update_stats(self):
+        session = self.session
+        self.stats_label.setText(f"Spins: {session.spin_count}  Wins: {session.total_wins}  Losses: {session.total_losses}")
+
+    def reset_game(self):
+        self.duration_timer.stop()
+        self.session.reset()
+        self.balance = self.session.balance
+        self.update_balance()
+        self.update_stats()
+        self.reels.show_row([0] * len(self.reels.reels))
+        self.message_label.setText("")
+        self.last_spin_label.setText("")
+        self.button.setDisabled(False)
+        self.bet_input.setDisabled(False)
+
+    def closeEvent(self, event):
+        self.session.close()
+        super().closeEvent(event)
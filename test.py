@@ -1,9 +1,15 @@
 
-import random
+import sys
+from slot_rng import SpinSource
+from slot_session import SlotSession, play_headless, headless_summary
+from slot_ledger import Ledger, LEDGER_FILE
+from slot_paytable import PAYTABLE
+
+# Set to SpinSource(seed) to replay the same spins
+spins = SpinSource()
 
 def spin_row() :
-    symbols = ["🍒", "🍉", "🍋", "🔔", "⭐"]
-    return [random.choice(symbols) for _ in range(3)]
+    return spins.spin()
 
 def print_row(row):
     print("*" * 20)
@@ -11,74 +17,48 @@ def print_row(row):
     print("*" * 20)
 
 def get_payout(row,bet):
-    if row[0] == row[1] == row[2] :
-        if row[0] == "🍒":
-            return bet * 4
-        elif row[0] == "🍉":
-            return bet * 6
-        elif row[0] == "🍋":
-            return bet * 8
-        elif row[0] == "🔔":
-            return bet * 12
-        elif row[0] == "⭐":
-            return bet * 20
-    # Check for two matching symbols (partial match)
-    if row[0] == row[1] or row[1] == row[2] :
-        if "🍒" in row:
-            return bet * 1.2
-        elif "🍉" in row:
-            return bet * 1.5
-        elif "🍋" in row:
-            return bet * 1.8
-        # elif "🔔" in row:
-        #     return bet * 3
-        # elif "⭐" in row:
-        #     return bet * 3.5
-    return 0
-            
+    # The rules live in slot_paytable (TRIPLES and PAIRS); edit them there
+    return PAYTABLE.payout(row, bet)
 
 def main():
-    balance = 1000
+    session = SlotSession(spins=spins, ledger=Ledger(LEDGER_FILE))
 
     print("*****************************")
     print("Welcome to the Slot Machine")
     print("Symbols: 🍒 🍉 🍋 🔔 ⭐")
     print("*****************************")
 
-    while balance > 0:
-        print(f"Your current balance is: ${balance}")
-        bet = input("Enter your bet : ")
+    try:
+        while not session.game_over:
+            print(f"Your current balance is: ${session.balance}")
+            bet = input("Enter your bet : ")
 
-        if not bet.isdigit() :
-            print("Enter a valid number")
-            continue
+            error = session.bet_error(bet)
+            if error:
+                print(error)
+                continue
 
-        bet = int(bet)
-        if bet > balance :
-            print("Isufficient balance")
-        elif bet <= 0:
-            print("bet must be greater than 0")
-            continue
+            spin = session.spin(int(bet))
+            print("Spinning...")
+            print_row(spin.symbols)
 
-        balance -= bet
+            if spin.payout == 0 :
+                print("You Lose")
+            else:
+                print(f"You win: {spin.payout}")
+            if session.game_over:
+                print("Game Over! No balance left.")
+                break
 
-        row = spin_row()
-        print("Spinning...")
-        print_row(row)
-        if balance == 0:
-            print("Insufficeint balance")
-            break
-        
-        payout = get_payout(row,bet)
-        if payout == 0 :
-            print("You Lose")
-        else:
-            print(f"You win: {payout}")
-            balance += payout
-    
-        if not input("Play Again? (Yes or No): ").lower() == "yes" :
-            print("Thanks for Playing")
-            break
-        print("*****************************")
+            if not input("Play Again? (Yes or No): ").lower() == "yes" :
+                print("Thanks for Playing")
+                break
+            print("*****************************")
+    finally:
+        session.close()
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # --headless plays 100 flat 10 bets with no prompts, e.g. for smoke tests
+    if "--headless" in sys.argv[1:]:
+        print(headless_summary(play_headless(bet=10, spins=100, ledger=Ledger(LEDGER_FILE))))
+    else:
+        main()
\ No newline at end of file
@@ -0,0 +1,135 @@
+import numpy as np
+
+from tetris_engine import COLS, ROWS, ROTATIONS
+
+# Feature weights (Dellacherie's features with El-Tetris tuning): landing
+# height, eroded piece cells, row transitions, column transitions, holes and
+# cumulative well depth
+WEIGHTS = np.array([-4.500158825082766, 3.4181268101392694, -3.2178882868487753,
+                    -9.348695305445199, -7.899265427351652, -3.3855972247263626])
+
+_BITS = 1 << np.arange(COLS)
+_ROW_INDEX = np.arange(ROWS)
+
+
+def _distinct_rotations(kind):
+    # O, I, S and Z repeat themselves; only score each distinct shape once
+    seen = []
+    for steps, state in enumerate(ROTATIONS[kind]):
+        if state.cells not in [ROTATIONS[kind][s].cells for s in seen]:
+            seen.append(steps)
+    return seen
+
+
+DISTINCT = tuple(_distinct_rotations(kind) for kind in range(len(ROTATIONS)))
+
+
+def placements(engine):
+    # Every (rotation steps, left column, landing row) reachable from the
+    # spawn position by rotating in place, sliding sideways, then dropping
+    kind = engine.current
+    top, left = engine.current_pos
+    rotation = engine.rotation
+    found = []
+    for steps in range(4):
+        state_rot = (rotation + steps) % 4
+        if steps and engine.collides(kind, state_rot, [top, left]):
+            break
+        if state_rot not in DISTINCT[kind]:
+            continue
+        state = ROTATIONS[kind][state_rot]
+        for step in (-1, 1):
+            col = left if step == -1 else left + 1
+            while 0 <= col <= COLS - state.width and not engine.collides(kind, state_rot, [top, col]):
+                landing = min(engine.surface[col+c] - b - 1 for c, b in enumerate(state.bottoms))
+                if landing >= top:
+                    found.append((steps, col, landing))
+                col += step
+    return found
+
+
+def _board_array(board):
+    return (np.array(board)[:, None] & _BITS) != 0
+
+
+def evaluate(engine, moves):
+    # Score all candidate placements in one batched pass; higher is better
+    kind = engine.current
+    rotation = engine.rotation
+    n = len(moves)
+    boards = np.repeat(_board_array(engine.board)[None], n, axis=0)
+    piece = np.zeros_like(boards)
+    idx, rows, cols = [], [], []
+    landing_height = np.empty(n)
+    for i, (steps, col, landing) in enumerate(moves):
+        state = ROTATIONS[kind][(rotation + steps) % 4]
+        landing_height[i] = ROWS - landing - (state.height - 1) / 2
+        for r, c in state.cells:
+            idx.append(i)
+            rows.append(landing + r)
+            cols.append(col + c)
+    boards[idx, rows, cols] = True
+    piece[idx, rows, cols] = True
+
+    full = boards.all(axis=2)
+    lines = full.sum(axis=1)
+    eroded = lines * (piece & full[:, :, None]).sum(axis=(1, 2))
+    # Clear full rows: move them to the top in a stable order, then empty them
+    order = np.argsort(~full, axis=1, kind='stable')
+    boards = np.take_along_axis(boards, order[:, :, None], axis=1)
+    boards &= (_ROW_INDEX[None, :] >= lines[:, None])[:, :, None]
+
+    # Walls and floor count as filled
+    walled = np.pad(boards, ((0, 0), (0, 0), (1, 1)), constant_values=True)
+    row_transitions = (walled[:, :, 1:] != walled[:, :, :-1]).sum(axis=(1, 2))
+    floored = np.pad(boards, ((0, 0), (0, 1), (0, 0)), constant_values=True)
+    col_transitions = (floored[:, 1:] != floored[:, :-1]).sum(axis=(1, 2))
+    covered = np.maximum.accumulate(boards, axis=1)
+    holes = (covered & ~boards).sum(axis=(1, 2))
+    # A well cell is empty with both neighbours filled; each adds its depth
+    # within the well it belongs to
+    well = ~boards & walled[:, :, :-2] & walled[:, :, 2:]
+    depth = np.zeros((n, COLS), dtype=np.int64)
+    wells = np.zeros(n, dtype=np.int64)
+    for r in range(ROWS):
+        depth = np.where(well[:, r], depth + 1, 0)
+        wells += depth.sum(axis=1)
+
+    features = np.stack([landing_height, eroded, row_transitions, col_transitions, holes, wells], axis=1)
+    return features @ WEIGHTS
+
+
+def best_move(engine):
+    # (rotation steps, target column) for the current piece, or None
+    if engine.game_over:
+        return None
+    moves = placements(engine)
+    if not moves:
+        return None
+    steps, col, _ = moves[int(np.argmax(evaluate(engine, moves)))]
+    return steps, col
+
+
+def plan_keys(engine, move):
+    # The key presses that carry out a move, for driving the Tk window
+    steps, col = move
+    shift = col - engine.current_pos[1]
+    side = 'Right' if shift > 0 else 'Left'
+    return ['Up'] * steps + [side] * abs(shift) + ['space']
+
+
+def play_move(engine, move=None):
+    # Apply the best (or given) move straight to a headless engine
+    if move is None:
+        move = best_move(engine)
+    if move is None:
+        engine.hard_drop()
+        return
+    steps, col = move
+    for _ in range(steps):
+        engine.rotate()
+    shift = col - engine.current_pos[1]
+    step = 1 if shift > 0 else -1
+    for _ in range(abs(shift)):
+        engine.move(step)
+    engine.hard_drop()
@@ -0,0 +1,173 @@
+import io
+import math
+import queue
+import shutil
+import struct
+import subprocess
+import sys
+import threading
+import time
+import wave
+
+RATE = 22050
+# (frequency Hz, duration ms) of each game sound
+SOUNDS = {
+    'line': (523, 60),
+    'move': (392, 20),
+    'rotate': (659, 40),
+    'gameover': (220, 300),
+    'drop': (349, 30),
+}
+STALE = 0.15  # seconds; older events are dropped instead of played late
+
+
+def synth(frequency, duration, volume=0.3):
+    # 16-bit mono sine PCM with short fades so back-to-back beeps don't click
+    n = int(RATE * duration / 1000)
+    fade = min(n // 4, RATE // 200)
+    amp = volume * 32767
+    samples = []
+    for i in range(n):
+        env = min(1.0, i / fade, (n - i) / fade) if fade else 1.0
+        samples.append(int(amp * env * math.sin(2 * math.pi * frequency * i / RATE)))
+    return struct.pack(f"<{n}h", *samples)
+
+
+def to_wav(pcm):
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(RATE)
+        w.writeframes(pcm)
+    return buf.getvalue()
+
+
+class NullBackend:
+    # Used headless or when no audio output is available
+    def play(self, name):
+        pass
+
+    def close(self):
+        pass
+
+
+class PipeBackend:
+    # One long-lived player process reading raw PCM from stdin
+    def __init__(self, cmd):
+        self.pcm = {name: synth(*tone) for name, tone in SOUNDS.items()}
+        self.proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def play(self, name):
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.write(self.pcm[name])
+            self.proc.stdin.flush()
+        except OSError:
+            # The player exited; stay quiet rather than fail on every sound
+            self.proc = None
+
+    def close(self):
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        self.proc.terminate()
+        self.proc = None
+
+
+class WinsoundBackend:
+    def __init__(self):
+        import winsound
+        self.winsound = winsound
+        self.wav = {name: to_wav(synth(*tone)) for name, tone in SOUNDS.items()}
+
+    def play(self, name):
+        self.winsound.PlaySound(self.wav[name], self.winsound.SND_MEMORY)
+
+    def close(self):
+        pass
+
+
+class BeepBackend:
+    # PC speaker fallback; still one process per sound, but no shell
+    def play(self, name):
+        frequency, duration = SOUNDS[name]
+        subprocess.run(['beep', '-f', str(frequency), '-l', str(duration)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def close(self):
+        pass
+
+
+def detect_backend():
+    # Probed once at startup instead of on every sound
+    try:
+        if sys.platform.startswith('win'):
+            return WinsoundBackend()
+        if shutil.which('aplay'):
+            return PipeBackend(['aplay', '-q', '-t', 'raw', '-f', 'S16_LE', '-r', str(RATE), '-c', '1'])
+        if shutil.which('play'):
+            return PipeBackend(['play', '-q', '-t', 'raw', '-r', str(RATE), '-e', 'signed', '-b', '16', '-c', '1', '-'])
+        if shutil.which('beep'):
+            return BeepBackend()
+    except Exception:
+        pass
+    return NullBackend()
+
+
+class AudioPlayer:
+    # A single worker thread plays sounds from a small bounded queue. When the
+    # queue is full the oldest event is discarded, and events that waited too
+    # long are skipped, so held keys never build up a backlog.
+    def __init__(self, backend=None, maxsize=4):
+        self.backend = backend if backend is not None else detect_backend()
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.thread = None
+        if not isinstance(self.backend, NullBackend):
+            self.thread = threading.Thread(target=self._run, name="tetris-audio", daemon=True)
+            self.thread.start()
+
+    def play(self, name):
+        if self.thread is None:
+            return
+        event = (time.monotonic(), name)
+        while True:
+            try:
+                self.queue.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _run(self):
+        while True:
+            event = self.queue.get()
+            if event is None:
+                break
+            queued_at, name = event
+            if time.monotonic() - queued_at > STALE:
+                continue
+            try:
+                self.backend.play(name)
+            except Exception:
+                pass
+
+    def close(self):
+        if self.thread is not None:
+            # Make room for the stop marker if the worker is behind
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put(None, timeout=1)
+            except queue.Full:
+                pass
+            self.thread.join(timeout=1)
+            self.thread = None
+        self.backend.close()
@@ -0,0 +1,177 @@
+import argparse
+import random
+import sys
+import timeit
+
+import bench_baseline
+from tetris_engine import TetrisEngine, COLS, ROWS, FULL_ROW, COLORS
+from tetris_render import BoardRenderer
+
+BASELINE = "tetris_bench_baseline.json"
+
+
+class StubCanvas:
+    # Accepts the canvas calls the renderers make and does nothing, so
+    # rendering cost can be measured without a display
+    def __init__(self):
+        self.next_id = 0
+
+    def _create(self, *args, **kwargs):
+        self.next_id += 1
+        return self.next_id
+
+    create_rectangle = create_text = _create
+
+    def itemconfig(self, *args, **kwargs):
+        pass
+
+    def coords(self, *args):
+        pass
+
+    def tag_raise(self, *args):
+        pass
+
+    def delete(self, *args):
+        pass
+
+
+def _fill(engine, rows):
+    # rows: {row index: bitmask}
+    for r, mask in rows.items():
+        engine.board[r] = mask
+        engine.colors[r] = [COLORS[(r + c) % len(COLORS)] if mask >> c & 1 else None for c in range(COLS)]
+    engine.surface = [next((r for r in range(ROWS) if engine.board[r] >> c & 1), ROWS) for c in range(COLS)]
+
+
+def make_states():
+    # Deterministic board states covering the cases the hot paths see
+    rng = random.Random(0)
+    states = {}
+
+    engine = TetrisEngine(rng=random.Random(1))
+    states["empty"] = engine
+
+    engine = TetrisEngine(rng=random.Random(2))
+    half = {}
+    for r in range(ROWS // 2, ROWS):
+        mask = 0
+        for c in range(COLS):
+            if rng.random() < 0.7:
+                mask |= 1 << c
+        half[r] = mask if mask != FULL_ROW else mask & ~(1 << rng.randrange(COLS))
+    _fill(engine, half)
+    states["half"] = engine
+
+    engine = TetrisEngine(rng=random.Random(3))
+    holes = {}
+    for r in range(3, ROWS):
+        mask = FULL_ROW
+        for _ in range(rng.randint(1, 3)):
+            mask &= ~(1 << rng.randrange(COLS))
+        holes[r] = mask
+    _fill(engine, holes)
+    states["holes"] = engine
+
+    # Four rows missing only column 0, with a vertical I above the well
+    engine = TetrisEngine(rng=random.Random(4))
+    _fill(engine, {r: FULL_ROW & ~1 for r in range(ROWS - 4, ROWS)})
+    engine.current, engine.rotation, engine.current_pos = 0, 1, [0, 0]
+    states["multiclear"] = engine
+    return states
+
+
+def _snapshot(engine):
+    return list(engine.board), [row[:] for row in engine.colors], list(engine.surface), list(engine.current_pos), engine.score, engine.lines_cleared, engine.level
+
+
+def _restore(engine, snap):
+    board, colors, surface, pos, score, lines, level = snap
+    engine.board = list(board)
+    engine.colors = [row[:] for row in colors]
+    engine.surface = list(surface)
+    engine.current_pos = list(pos)
+    engine.score, engine.lines_cleared, engine.level = score, lines, level
+    engine.game_over = False
+
+
+def _time(fn, repeat, target=0.02):
+    # Best of `repeat` runs, each sized to take roughly `target` seconds
+    timer = timeit.Timer(fn)
+    number = 1
+    while timer.timeit(number) < target / 10:
+        number *= 10
+    elapsed = timer.timeit(number)
+    number = max(1, int(number * target / max(elapsed, 1e-9)))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def measure(fn, repeat=9, reset=None):
+    # Seconds per call; when fn needs a fresh state, the cost of resetting
+    # it is measured separately and subtracted
+    if reset is None:
+        return _time(fn, repeat)
+
+    def both():
+        reset()
+        fn()
+    return max(0.0, _time(both, repeat) - _time(reset, repeat))
+
+
+def benchmarks(states):
+    cases = {}
+    for name, engine in states.items():
+        snap = _snapshot(engine)
+        kind, rot = engine.current, engine.rotation
+        ghost = [engine.current_pos[0] + engine.drop_distance(), engine.current_pos[1]]
+        cases[f"collides/{name}"] = (lambda e=engine, k=kind, r=rot, p=ghost: e.collides(k, r, p), None)
+        cases[f"ghost/{name}"] = (engine.drop_distance, None)
+
+        def merge(e=engine, p=ghost):
+            e.current_pos = list(p)
+            e._merge()
+        cases[f"merge/{name}"] = (merge, lambda e=engine, s=snap: _restore(e, s))
+
+        def clear(e=engine, p=ghost):
+            e.current_pos = list(p)
+            e._merge()
+            e._clear_lines()
+        cases[f"merge+clear/{name}"] = (clear, lambda e=engine, s=snap: _restore(e, s))
+
+        # Alternate the piece between two columns so each draw has a diff
+        renderer = BoardRenderer(StubCanvas(), 30)
+        renderer.draw(engine)
+        state = {"flip": False}
+
+        shifted = [engine.current_pos[0], engine.current_pos[1] + 1]
+        alt = shifted if not engine.collides(kind, rot, shifted) else list(engine.current_pos)
+
+        def draw(e=engine, r=renderer, s=state, positions=(list(engine.current_pos), alt)):
+            s["flip"] = not s["flip"]
+            e.current_pos = list(positions[s["flip"]])
+            r.draw(e)
+        cases[f"draw_board/{name}"] = (draw, None)
+    return cases
+
+
+def run(repeat=9, only=None):
+    results = {}
+    for name, (fn, reset) in benchmarks(make_states()).items():
+        if only and only not in name:
+            continue
+        results[name] = measure(fn, repeat, reset) * 1e6
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for the Tetris hot paths.")
+    bench_baseline.add_arguments(parser, BASELINE, threshold=20.0, repeat=9, what="runs")
+    parser.add_argument("--only", help="run only benchmarks whose name contains this")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat, args.only)
+    # Slowdowns under 0.05 us are noise at this scale
+    return bench_baseline.report(args, results, floor=0.05, unit="us", width=28, what="benchmark")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+import argparse
+import random
+import sys
+
+from tetris_ai import best_move, plan_keys
+from tetris_engine import TetrisEngine, Snapshot, ROTATIONS, SHAPES, COLORS, COLS, ROWS, surface_of
+
+ACTIONS = ["left", "right", "down", "rotate", "drop", "hold", "tick"]
+# Soft drops and gravity are weighted up so random pieces reach the stack
+WEIGHTS = [3, 3, 4, 3, 1, 1, 6]
+# Share of pieces placed by the AI instead of random inputs; random play
+# alone almost never clears a line
+AI_SHARE = 0.75
+KEY_ACTIONS = {"Up": "rotate", "Left": "left", "Right": "right", "space": "drop"}
+
+
+class Reference:
+    # The original window's rules, kept as they were before the engine: a
+    # ROWS x COLS grid of colors and pieces as shape matrices. It draws from
+    # its rng in the same order, so one seed gives both the same pieces.
+    def __init__(self, rng):
+        self.rng = rng
+        self.board = [[None for _ in range(COLS)] for _ in range(ROWS)]
+        self.score = 0
+        self.lines_cleared = 0
+        self.level = 1
+        self.current = None
+        self.current_color = None
+        self.current_pos = [0, 3]
+        self.next_piece = None
+        self.next_color = None
+        self.hold_piece = None
+        self.hold_color = None
+        self.hold_used = False
+        self.game_over = False
+        self._new_piece(init=True)
+
+    def _new_piece(self, init=False):
+        if init:
+            idx = self.rng.randint(0, len(SHAPES)-1)
+            self.current = [row[:] for row in SHAPES[idx]]
+            self.current_color = COLORS[idx]
+        else:
+            self.current = self.next_piece
+            self.current_color = self.next_color
+        idx2 = self.rng.randint(0, len(SHAPES)-1)
+        self.next_piece = [row[:] for row in SHAPES[idx2]]
+        self.next_color = COLORS[idx2]
+        self.current_pos = [0, COLS//2 - len(self.current[0])//2]
+        if self._collides(self.current, self.current_pos):
+            self.game_over = True
+            return
+        self.hold_used = False
+
+    def _collides(self, shape, pos):
+        for r, row in enumerate(shape):
+            for c, val in enumerate(row):
+                if val:
+                    rr = pos[0]+r
+                    cc = pos[1]+c
+                    if rr < 0 or rr >= ROWS or cc < 0 or cc >= COLS:
+                        return True
+                    if self.board[rr][cc]:
+                        return True
+        return False
+
+    def _merge(self):
+        for r, row in enumerate(self.current):
+            for c, val in enumerate(row):
+                if val:
+                    self.board[self.current_pos[0]+r][self.current_pos[1]+c] = self.current_color
+        if any(self.board[0][col] is not None for col in range(COLS)):
+            self.game_over = True
+            return
+        self._clear_lines()
+        self._new_piece()
+
+    def _clear_lines(self):
+        new_board = [row for row in self.board if any(cell is None for cell in row)]
+        lines_cleared = ROWS - len(new_board)
+        for _ in range(lines_cleared):
+            new_board.insert(0, [None for _ in range(COLS)])
+        self.board = new_board
+        if lines_cleared > 0:
+            self.lines_cleared += lines_cleared
+            self.level = 1 + self.lines_cleared // 10
+        self.score += lines_cleared * 100 * self.level
+
+    def play(self, action):
+        if self.game_over:
+            return
+        if action in ("left", "right"):
+            pos = [self.current_pos[0], self.current_pos[1] + (-1 if action == "left" else 1)]
+            if not self._collides(self.current, pos):
+                self.current_pos = pos
+        elif action == "down":
+            pos = [self.current_pos[0]+1, self.current_pos[1]]
+            if not self._collides(self.current, pos):
+                self.current_pos = pos
+        elif action == "tick":
+            pos = [self.current_pos[0]+1, self.current_pos[1]]
+            if not self._collides(self.current, pos):
+                self.current_pos = pos
+            else:
+                self._merge()
+        elif action == "rotate":
+            rotated = [list(row) for row in zip(*self.current[::-1])]
+            if not self._collides(rotated, self.current_pos):
+                self.current = rotated
+        elif action == "drop":
+            while not self._collides(self.current, [self.current_pos[0]+1, self.current_pos[1]]):
+                self.current_pos[0] += 1
+            self._merge()
+        elif action == "hold":
+            if not self.hold_used:
+                if self.hold_piece is None:
+                    self.hold_piece = [row[:] for row in self.current]
+                    self.hold_color = self.current_color
+                    self._new_piece()
+                else:
+                    self.hold_piece, self.current = [row[:] for row in self.current], [row[:] for row in self.hold_piece]
+                    self.hold_color, self.current_color = self.current_color, self.hold_color
+                    self.current_pos = [0, COLS//2 - len(self.current[0])//2]
+                self.hold_used = True
+
+
+def play(engine, action):
+    if action == "left":
+        engine.move(-1)
+    elif action == "right":
+        engine.move(1)
+    elif action == "down":
+        engine.step_down()
+    elif action == "rotate":
+        engine.rotate()
+    elif action == "drop":
+        engine.hard_drop()
+    elif action == "hold":
+        engine.hold()
+    elif action == "tick":
+        engine.tick()
+
+
+def _cells(shape):
+    return tuple((r, c) for r, row in enumerate(shape) for c, val in enumerate(row) if val)
+
+
+def differences(engine, ref):
+    # Names of everything the engine and the reference disagree on
+    bad = []
+    if engine.colors != ref.board:
+        bad.append("board")
+    if engine.board != [sum(1 << c for c in range(COLS) if row[c] is not None) for row in ref.board]:
+        bad.append("bitboard")
+    if tuple(engine.surface) != surface_of(engine.board):
+        bad.append("surface")
+    if engine.game_over != ref.game_over:
+        bad.append("game_over")
+    if (engine.score, engine.lines_cleared, engine.level) != (ref.score, ref.lines_cleared, ref.level):
+        bad.append("score")
+    if engine.hold_used != ref.hold_used or engine.hold_color != ref.hold_color:
+        bad.append("hold")
+    elif engine.hold_piece is not None and ROTATIONS[engine.hold_piece][engine.hold_rotation].cells != _cells(ref.hold_piece):
+        bad.append("hold rotation")
+    if engine.next_color != ref.next_color:
+        bad.append("next")
+    if engine.current_color != ref.current_color or engine.current_cells() != _cells(ref.current):
+        bad.append("current")
+    elif engine.current_pos != ref.current_pos:
+        bad.append("position")
+    elif not engine.game_over and engine.drop_distance() != engine._scan_drop_distance():
+        bad.append("drop distance")
+    return bad
+
+
+def check_game(seed, moves):
+    # Plays one seeded game on the engine and the reference side by side,
+    # with each piece either placed by the AI or pushed about at random.
+    # Every few moves the engine's snapshot is round-tripped through bytes
+    # and play continues on a second engine restored from it. Returns None,
+    # or a description of the first difference.
+    inputs = random.Random(seed)
+    engine = TetrisEngine(random.Random(seed))
+    ref = Reference(random.Random(seed))
+    planned = []
+    piece = None
+    for move in range(moves):
+        if move % 50 == 0:
+            snap = engine.snapshot()
+            copy = Snapshot.from_bytes(snap.to_bytes())
+            if copy != snap:
+                fields = [name for name in snap._fields if getattr(copy, name) != getattr(snap, name)]
+                return f"seed {seed} move {move}: snapshot round trip changed {', '.join(fields)}"
+            engine = TetrisEngine(random.Random())
+            engine.restore(copy)
+        if (engine.pieces_placed, engine.hold_used) != piece:
+            piece = (engine.pieces_placed, engine.hold_used)
+            planned = []
+            if inputs.random() < AI_SHARE:
+                plan = best_move(engine)
+                if plan is not None:
+                    planned = [KEY_ACTIONS[key] for key in plan_keys(engine, plan)]
+        action = planned.pop(0) if planned else inputs.choices(ACTIONS, WEIGHTS)[0]
+        play(engine, action)
+        ref.play(action)
+        bad = differences(engine, ref)
+        if bad:
+            return f"seed {seed} move {move} ({action}): {', '.join(bad)} differ"
+        if engine.game_over:
+            break
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the engine against the original rules over random games.")
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--moves", type=int, default=2000, help="inputs per game at most")
+    parser.add_argument("--seed", type=int, default=0, help="first game's seed")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for seed in range(args.seed, args.seed + args.games):
+        failure = check_game(seed, args.moves)
+        if failure:
+            print(failure, file=sys.stderr)
+            failures += 1
+    print(f"{args.games - failures}/{args.games} games match the original rules")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+import random
+import struct
+from collections import deque, namedtuple
+
+COLS = 10
+ROWS = 20
+SPEED = 500  # ms
+UNDO_DEPTH = 50  # pieces the windowed game and replays can undo
+SAVE_FILE = "tetris_save.bin"  # where F5 writes a Snapshot for --resume
+
+SHAPES = [
+    [[1, 1, 1, 1]],  # I
+    [[1, 1], [1, 1]],  # O
+    [[0, 1, 0], [1, 1, 1]],  # T
+    [[1, 0, 0], [1, 1, 1]],  # J
+    [[0, 0, 1], [1, 1, 1]],  # L
+    [[1, 1, 0], [0, 1, 1]],  # S
+    [[0, 1, 1], [1, 1, 0]],  # Z
+]
+COLORS = ["cyan", "yellow", "purple", "blue", "orange", "green", "red"]
+
+# Each board row is an int bitmask: bit c set means column c is filled
+FULL_ROW = (1 << COLS) - 1
+
+# One compiled rotation state of a piece: occupied (row, col) offsets, the
+# per-row bitmasks already shifted to every legal left column, its size, and
+# the lowest occupied row offset in each of its columns
+Rotation = namedtuple('Rotation', 'cells masks height width bottoms')
+
+
+def row_masks(shape):
+    # Bitmask of every shape row, with column 0 of the shape at bit 0
+    return [sum(1 << c for c, val in enumerate(row) if val) for row in shape]
+
+
+def _rotate(shape):
+    # Clockwise quarter turn
+    return [list(row) for row in zip(*shape[::-1])]
+
+
+def _compile(shape):
+    states = []
+    for _ in range(4):
+        height, width = len(shape), len(shape[0])
+        cells = tuple((r, c) for r, row in enumerate(shape) for c, val in enumerate(row) if val)
+        masks = row_masks(shape)
+        shifted = tuple(tuple(m << left for m in masks) for left in range(COLS - width + 1))
+        bottoms = tuple(max(r for r, c in cells if c == col) for col in range(width))
+        states.append(Rotation(cells, shifted, height, width, bottoms))
+        shape = _rotate(shape)
+    return tuple(states)
+
+
+# ROTATIONS[kind][rotation], compiled once so play never builds matrices
+ROTATIONS = tuple(_compile(shape) for shape in SHAPES)
+
+
+_SNAPSHOT_HEADER = struct.Struct(f"<4s{ROWS}H{ROWS*COLS}sBBbbBBBBQIHI")
+_RNG_STATE = struct.Struct("<B625IBd")
+_NO_PIECE = 0xFF
+
+
+class Snapshot(namedtuple('Snapshot', 'board colors surface current rotation pos next_piece hold_piece '
+                                      'hold_rotation hold_used score lines_cleared level pieces_placed '
+                                      'game_over rng_state')):
+    # Immutable copy of a whole game, taken with TetrisEngine.snapshot().
+    # Everything is tuples and ints, so taking and restoring one costs a few
+    # microseconds; to_bytes() packs it for saving to disk.
+    __slots__ = ()
+    MAGIC = b"TSN1"
+
+    def to_bytes(self):
+        index = {color: i + 1 for i, color in enumerate(COLORS)}
+        colors = bytes(index.get(color, 0) for row in self.colors for color in row)
+        flags = (1 if self.hold_used else 0) | (2 if self.game_over else 0)
+        hold = _NO_PIECE if self.hold_piece is None else self.hold_piece
+        header = _SNAPSHOT_HEADER.pack(self.MAGIC, *self.board, colors, self.current, self.rotation,
+                                       self.pos[0], self.pos[1], self.next_piece, hold, self.hold_rotation,
+                                       flags, self.score, self.lines_cleared, self.level, self.pieces_placed)
+        version, state, gauss = self.rng_state
+        rng = _RNG_STATE.pack(version, *state, gauss is not None, gauss or 0.0)
+        return header + rng
+
+    @classmethod
+    def from_bytes(cls, data):
+        fields = _SNAPSHOT_HEADER.unpack_from(data)
+        if fields[0] != cls.MAGIC:
+            raise ValueError("not a Tetris snapshot")
+        board = fields[1:1+ROWS]
+        packed = fields[1+ROWS]
+        (current, rotation, row, col, next_piece, hold, hold_rotation, flags,
+         score, lines, level, pieces) = fields[2+ROWS:]
+        colors = tuple(tuple(COLORS[i-1] if i else None for i in packed[r*COLS:(r+1)*COLS]) for r in range(ROWS))
+        rng = _RNG_STATE.unpack_from(data, _SNAPSHOT_HEADER.size)
+        rng_state = (rng[0], rng[1:626], rng[627] if rng[626] else None)
+        return cls(tuple(board), colors, surface_of(board), current, rotation, (row, col), next_piece,
+                   None if hold == _NO_PIECE else hold, hold_rotation, bool(flags & 1), score, lines,
+                   level, pieces, bool(flags & 2), rng_state)
+
+
+def surface_of(board):
+    return tuple(next((r for r in range(ROWS) if board[r] >> c & 1), ROWS) for c in range(COLS))
+
+
+class TetrisEngine:
+    # Game rules without any display. The board is stored as ROWS int
+    # bitmasks; colors live in a parallel ROWS x COLS array that is only
+    # read by views.
+    def __init__(self, rng=None, on_event=None, history=0):
+        self.rng = rng if rng is not None else random
+        # Called with 'lock', 'line' and 'gameover'; views use it for sound and labels
+        self.on_event = on_event
+        # Snapshots taken as each of the last `history` pieces spawned, for undo()
+        self.history = deque(maxlen=history) if history else None
+        self._spawn_state = None
+        self.reset()
+
+    def reset(self):
+        self.board = [0] * ROWS
+        self.colors = [[None] * COLS for _ in range(ROWS)]
+        # Row of the topmost filled cell in each column, ROWS when empty
+        self.surface = [ROWS] * COLS
+        self.score = 0
+        self.lines_cleared = 0
+        self.level = 1
+        self.pieces_placed = 0
+        # Pieces are SHAPES indices; rotations index into ROTATIONS[kind]
+        self.current = None
+        self.rotation = 0
+        self.current_pos = [0, 3]
+        self.next_piece = None
+        self.hold_piece = None
+        self.hold_rotation = 0
+        self.hold_used = False
+        self.game_over = False
+        if self.history is not None:
+            self.history.clear()
+        self._new_piece(init=True)
+
+    def snapshot(self):
+        return Snapshot(tuple(self.board), tuple(map(tuple, self.colors)), tuple(self.surface),
+                        self.current, self.rotation, tuple(self.current_pos), self.next_piece,
+                        self.hold_piece, self.hold_rotation, self.hold_used, self.score,
+                        self.lines_cleared, self.level, self.pieces_placed, self.game_over,
+                        self.rng.getstate())
+
+    def restore(self, snap):
+        self.board = list(snap.board)
+        self.colors = [list(row) for row in snap.colors]
+        self.surface = list(snap.surface)
+        self.current = snap.current
+        self.rotation = snap.rotation
+        self.current_pos = list(snap.pos)
+        self.next_piece = snap.next_piece
+        self.hold_piece = snap.hold_piece
+        self.hold_rotation = snap.hold_rotation
+        self.hold_used = snap.hold_used
+        self.score = snap.score
+        self.lines_cleared = snap.lines_cleared
+        self.level = snap.level
+        self.pieces_placed = snap.pieces_placed
+        self.game_over = snap.game_over
+        self.rng.setstate(snap.rng_state)
+        self._spawn_state = snap if self.history is not None else None
+
+    def undo(self):
+        # Put back the board as it was when the previous piece spawned
+        if not self.history:
+            return False
+        self.restore(self.history.pop())
+        return True
+
+    @property
+    def current_color(self):
+        return COLORS[self.current] if self.current is not None else None
+
+    @property
+    def next_color(self):
+        return COLORS[self.next_piece] if self.next_piece is not None else None
+
+    @property
+    def hold_color(self):
+        return COLORS[self.hold_piece] if self.hold_piece is not None else None
+
+    def _emit(self, event):
+        if self.on_event is not None:
+            self.on_event(event)
+
+    def speed(self):
+        # Classic Tetris: speed increases with level, min 50ms
+        return max(50, SPEED - (self.level-1)*40)
+
+    def _random_piece(self):
+        return self.rng.randint(0, len(SHAPES)-1)
+
+    def _spawn_pos(self, kind, rotation):
+        return [0, COLS//2 - ROTATIONS[kind][rotation].width//2]
+
+    def _new_piece(self, init=False):
+        if init:
+            self.current = self._random_piece()
+        else:
+            self.current = self.next_piece
+        self.rotation = 0
+        self.next_piece = self._random_piece()
+        self.current_pos = self._spawn_pos(self.current, 0)
+        if self.collides(self.current, self.rotation, self.current_pos):
+            self._set_game_over()
+            return
+        self.hold_used = False
+        if self.history is not None:
+            self._spawn_state = self.snapshot()
+
+    def _set_game_over(self):
+        self.game_over = True
+        self._emit('gameover')
+
+    def current_cells(self):
+        return ROTATIONS[self.current][self.rotation].cells
+
+    def collides(self, kind, rotation, pos):
+        top, left = pos
+        state = ROTATIONS[kind][rotation]
+        if left < 0 or left + state.width > COLS or top < 0 or top + state.height > ROWS:
+            return True
+        board = self.board
+        for r, mask in enumerate(state.masks[left]):
+            if board[top+r] & mask:
+                return True
+        return False
+
+    def drop_distance(self):
+        top, left = self.current_pos
+        state = ROTATIONS[self.current][self.rotation]
+        surface = self.surface
+        dist = ROWS
+        for c, bottom in enumerate(state.bottoms):
+            gap = surface[left+c] - top - bottom - 1
+            if gap < 0:
+                # Piece is tucked under an overhang; the surface says nothing
+                return self._scan_drop_distance()
+            if gap < dist:
+                dist = gap
+        return dist
+
+    def _scan_drop_distance(self):
+        top, left = self.current_pos
+        dist = 0
+        while not self.collides(self.current, self.rotation, [top+dist+1, left]):
+            dist += 1
+        return dist
+
+    def move(self, dx):
+        pos = [self.current_pos[0], self.current_pos[1]+dx]
+        if self.game_over or self.collides(self.current, self.rotation, pos):
+            return False
+        self.current_pos = pos
+        return True
+
+    def step_down(self):
+        pos = [self.current_pos[0]+1, self.current_pos[1]]
+        if self.game_over or self.collides(self.current, self.rotation, pos):
+            return False
+        self.current_pos = pos
+        return True
+
+    def rotate(self):
+        if self.game_over:
+            return False
+        rotation = (self.rotation + 1) % 4
+        if self.collides(self.current, rotation, self.current_pos):
+            return False
+        self.rotation = rotation
+        return True
+
+    def hard_drop(self):
+        if self.game_over:
+            return
+        self.current_pos[0] += self.drop_distance()
+        self.lock()
+
+    def hold(self):
+        if self.game_over or self.hold_used:
+            return False
+        if self.hold_piece is None:
+            self.hold_piece, self.hold_rotation = self.current, self.rotation
+            self._new_piece()
+        else:
+            self.hold_piece, self.current = self.current, self.hold_piece
+            self.hold_rotation, self.rotation = self.rotation, self.hold_rotation
+            self.current_pos = self._spawn_pos(self.current, self.rotation)
+        self.hold_used = True
+        if self.history is not None:
+            # Undo goes back to after the hold, not before it
+            self._spawn_state = self.snapshot()
+        return True
+
+    def tick(self):
+        # One gravity step: fall a row or lock the piece in place
+        if self.game_over:
+            return
+        if not self.step_down():
+            self.lock()
+
+    def lock(self):
+        if self.history is not None and self._spawn_state is not None:
+            self.history.append(self._spawn_state)
+        self._merge()
+        self.pieces_placed += 1
+        # Game over if anything reaches the top row after merging
+        if self.board[0]:
+            self._emit('lock')
+            self._set_game_over()
+            return
+        self._clear_lines()
+        self._emit('lock')
+        self._new_piece()
+
+    def _merge(self):
+        top, left = self.current_pos
+        state = ROTATIONS[self.current][self.rotation]
+        for r, mask in enumerate(state.masks[left]):
+            self.board[top+r] |= mask
+        color = COLORS[self.current]
+        colors = self.colors
+        surface = self.surface
+        for r, c in state.cells:
+            colors[top+r][left+c] = color
+            if top+r < surface[left+c]:
+                surface[left+c] = top+r
+
+    def _clear_lines(self):
+        full = [r for r in range(ROWS) if self.board[r] == FULL_ROW]
+        if not full:
+            return 0
+        cleared = len(full)
+        full = set(full)
+        keep = [r for r in range(ROWS) if r not in full]
+        self.board = [0] * cleared + [self.board[r] for r in keep]
+        self.colors = [[None] * COLS for _ in range(cleared)] + [self.colors[r] for r in keep]
+        self._shift_surface(full)
+        self.lines_cleared += cleared
+        # Level up every 10 lines
+        self.level = 1 + self.lines_cleared // 10
+        self.score += cleared * 100 * self.level
+        self._emit('line')
+        return cleared
+
+    def _shift_surface(self, full):
+        # Move each column's surface down past the cleared rows beneath it,
+        # scanning the new board only when the surface row itself was cleared
+        surface = self.surface
+        for c in range(COLS):
+            top = surface[c]
+            if top == ROWS:
+                continue
+            if top not in full:
+                surface[c] = top + sum(1 for r in full if r > top)
+                continue
+            bit = 1 << c
+            new_top = ROWS
+            for r in range(top + sum(1 for r in full if r > top), ROWS):
+                if self.board[r] & bit:
+                    new_top = r
+                    break
+            surface[c] = new_top
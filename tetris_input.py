@@ -0,0 +1,80 @@
+from tetris_engine import COLS
+
+DAS = 0.167  # seconds a Left/Right key is held before it starts repeating
+ARR = 0.033  # seconds between repeats once it does; 0 slides to the wall
+SHIFT_KEYS = ('Left', 'Right')
+
+
+class InputState:
+    # Tracks which keys are held and turns them into moves once per frame.
+    # Presses are edge-triggered: OS key-repeat is ignored, and Left/Right
+    # repeat on their own DAS/ARR timing instead.
+    def __init__(self, das=DAS, arr=ARR):
+        self.das = das
+        self.arr = arr
+        self.held = {}
+        self.pressed = []
+        # key -> event time of a release that may be half of an X11 repeat pair
+        self.releasing = {}
+        self.shift = None
+        self.shift_repeats = 0
+
+    def press(self, key, now, event_time=None):
+        if key in self.releasing:
+            # X11 auto-repeat sends Release+Press with the same timestamp
+            if event_time is not None and event_time == self.releasing[key]:
+                del self.releasing[key]
+                return
+            self._release(key, now)
+        if key in self.held:
+            return
+        self.held[key] = now
+        self.pressed.append(key)
+        if key in SHIFT_KEYS:
+            # The most recent direction wins while both are held
+            self.shift = key
+            self.shift_repeats = 0
+
+    def release(self, key, event_time=None):
+        if key in self.held:
+            self.releasing[key] = event_time
+
+    def _release(self, key, now):
+        self.releasing.pop(key, None)
+        self.held.pop(key, None)
+        if key == self.shift:
+            self.shift = next((k for k in SHIFT_KEYS if k in self.held), None)
+            self.shift_repeats = 0
+            if self.shift is not None:
+                # The other held direction takes over and restarts its DAS
+                self.held[self.shift] = now
+
+    def is_held(self, key):
+        return key in self.held
+
+    def clear(self):
+        self.held.clear()
+        self.pressed = []
+        self.releasing.clear()
+        self.shift = None
+        self.shift_repeats = 0
+
+    def poll(self, now):
+        # Keys to apply this frame, in order: new presses, then any DAS/ARR
+        # repeats that came due since the last frame
+        for key in list(self.releasing):
+            self._release(key, now)
+        keys = self.pressed
+        self.pressed = []
+        shift = self.shift
+        if shift is not None:
+            held_for = now - self.held[shift]
+            if held_for >= self.das:
+                if self.arr <= 0:
+                    due = COLS
+                else:
+                    due = int((held_for - self.das) / self.arr) + 1
+                if due > self.shift_repeats:
+                    keys = keys + [shift] * (due - self.shift_repeats)
+                    self.shift_repeats = due
+        return keys
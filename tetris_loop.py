@@ -0,0 +1,86 @@
+import time
+from collections import deque
+
+
+class GameLoop:
+    # Fixed-timestep scheduler on top of Tk's after(). Logic steps are due at
+    # absolute monotonic deadlines, so time spent stepping or rendering never
+    # stretches the interval; the loop owns at most one pending after() handle.
+    def __init__(self, widget, step, render, interval, max_steps=5, jitter_window=240):
+        self.widget = widget
+        self.step = step
+        self.render = render
+        # Seconds until the next logic step; read again after every step
+        self.interval = interval
+        # Steps run in one wakeup before the backlog is dropped
+        self.max_steps = max_steps
+        self.running = False
+        self.paused = False
+        self._handle = None
+        self._next = 0.0
+        self._remaining = 0.0
+        self._lateness = deque(maxlen=jitter_window)
+
+    def start(self):
+        self._cancel()
+        self.running = True
+        self.paused = False
+        self._next = time.monotonic() + self.interval()
+        self._arm()
+
+    def stop(self):
+        self.running = False
+        self.paused = False
+        self._cancel()
+
+    def pause(self):
+        if not self.running or self.paused:
+            return
+        self.paused = True
+        self._remaining = max(0.0, self._next - time.monotonic())
+        self._cancel()
+
+    def resume(self):
+        if not self.running or not self.paused:
+            return
+        self.paused = False
+        # Carry over the part of the step that was left, not the paused time
+        self._next = time.monotonic() + self._remaining
+        self._arm()
+
+    def jitter(self):
+        # (mean, p99, max) lateness of wakeups versus their deadline, in ms
+        if not self._lateness:
+            return 0.0, 0.0, 0.0
+        late = sorted(self._lateness)
+        p99 = late[min(len(late) - 1, int(len(late) * 0.99))]
+        return sum(late) / len(late) * 1000, p99 * 1000, late[-1] * 1000
+
+    def _cancel(self):
+        if self._handle is not None:
+            self.widget.after_cancel(self._handle)
+            self._handle = None
+
+    def _arm(self):
+        self._cancel()
+        # Truncate so rounding never makes us late; an early wakeup just re-arms
+        delay = max(0, int((self._next - time.monotonic()) * 1000))
+        self._handle = self.widget.after(delay, self._frame)
+
+    def _frame(self):
+        self._handle = None
+        now = time.monotonic()
+        if now >= self._next:
+            self._lateness.append(now - self._next)
+        steps = 0
+        while self.running and now >= self._next:
+            self.step()
+            steps += 1
+            if steps >= self.max_steps:
+                self._next = now + self.interval()
+                break
+            self._next += self.interval()
+        if steps:
+            self.render()
+        if self.running:
+            self._arm()
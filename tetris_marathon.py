@@ -0,0 +1,187 @@
+import argparse
+import math
+import random
+import time
+import tkinter as tk
+
+from tetris_engine import TetrisEngine, COLS, ROWS
+from tetris_input import InputState
+from tetris_loop import GameLoop
+from tetris_render import BoardRenderer
+from tetris_replay import KEY_CODES, CODE_KEYS, apply, new_seed
+
+FRAME = 1 / 60  # seconds per logic frame, shared by every board
+GAP = 10  # pixels between boards
+LABEL_HEIGHT = 18
+
+
+class HumanController:
+    # Keyboard player; the window feeds it key events
+    def __init__(self):
+        self.input = InputState()
+
+    def step(self, board, now):
+        for key in self.input.poll(now):
+            board.press(key)
+        board.soft_drop = self.input.is_held('Down')
+
+
+class AIController:
+    # Plays like a person would: one planned key press every `every` frames
+    def __init__(self, every=4):
+        self.every = every
+        self.wait = 0
+        self.plan = []
+        self.plan_for = None
+
+    def step(self, board, now):
+        self.wait -= 1
+        if self.wait > 0:
+            return
+        self.wait = self.every
+        import tetris_ai
+        # Gravity may have locked the piece before its plan finished
+        piece = (board.engine.pieces_placed, board.engine.hold_used)
+        if piece != self.plan_for:
+            self.plan = []
+            self.plan_for = piece
+        if not self.plan:
+            move = tetris_ai.best_move(board.engine)
+            self.plan = tetris_ai.plan_keys(board.engine, move) if move else ['space']
+        board.press(self.plan.pop(0))
+
+
+class BenchController:
+    # Places a whole piece every frame, gravity or not
+    def step(self, board, now):
+        import tetris_ai
+        tetris_ai.play_move(board.engine)
+        board.dirty = True
+
+
+CONTROLLERS = {"human": HumanController, "ai": AIController, "bench": BenchController}
+
+
+class Board:
+    # One game in the marathon: engine, controller, gravity clock and the
+    # part of the shared canvas it draws to
+    def __init__(self, canvas, kind, seed, cell_size, origin):
+        self.kind = kind
+        self.engine = TetrisEngine(rng=random.Random(seed))
+        self.controller = CONTROLLERS[kind]()
+        self.renderer = BoardRenderer(canvas, cell_size, origin)
+        self.canvas = canvas
+        ox, oy = origin
+        canvas.create_rectangle(ox, oy, ox + COLS*cell_size, oy + ROWS*cell_size, outline="gray")
+        self.label = canvas.create_text(ox, oy + ROWS*cell_size + 3, anchor="nw", fill="white", font=("Arial", 9))
+        self.shown_label = None
+        self.gravity_clock = 0.0
+        self.soft_drop = False
+        self.dirty = True
+
+    def press(self, key):
+        code = KEY_CODES.get(key)
+        if code is not None and not self.engine.game_over:
+            apply(self.engine, code)
+            self.dirty = True
+
+    def step(self, now):
+        engine = self.engine
+        self.controller.step(self, now)
+        if engine.game_over:
+            return
+        self.gravity_clock += FRAME
+        interval = 0.03 if self.soft_drop else engine.speed() / 1000
+        while self.gravity_clock >= interval and not engine.game_over:
+            self.gravity_clock -= interval
+            engine.tick()
+            self.dirty = True
+
+    def draw(self):
+        self.dirty = False
+        self.renderer.draw(self.engine)
+        engine = self.engine
+        label = f"{self.kind}  {engine.score}  lines {engine.lines_cleared}"
+        if engine.game_over:
+            label += "  over"
+        if label != self.shown_label:
+            self.shown_label = label
+            self.canvas.itemconfig(self.label, text=label)
+
+
+class Marathon(tk.Tk):
+    # N boards in one window, stepped by one GameLoop and drawn on one canvas.
+    # Boards whose game is over are skipped entirely, and only boards that
+    # changed during a frame are redrawn.
+    def __init__(self, kinds, seed=None, cell_size=None, columns=None):
+        super().__init__()
+        self.title("Tetris Marathon")
+        self.resizable(False, False)
+        n = len(kinds)
+        columns = columns or min(n, max(1, math.ceil(math.sqrt(n * 2))))
+        rows = math.ceil(n / columns)
+        if cell_size is None:
+            # Fit the grid on a typical 1080p screen
+            cell_size = max(4, min(30, (1800 // columns - GAP) // COLS, (950 // rows - GAP - LABEL_HEIGHT) // ROWS))
+        board_w = COLS * cell_size + GAP
+        board_h = ROWS * cell_size + GAP + LABEL_HEIGHT
+        self.canvas = tk.Canvas(self, width=columns * board_w + GAP, height=rows * board_h + GAP, bg="black", highlightthickness=0)
+        self.canvas.pack()
+        seed = new_seed() if seed is None else seed
+        self.boards = []
+        for i, kind in enumerate(kinds):
+            origin = (GAP + (i % columns) * board_w, GAP + (i // columns) * board_h)
+            self.boards.append(Board(self.canvas, kind, seed + i, cell_size, origin))
+        self.humans = [b.controller for b in self.boards if isinstance(b.controller, HumanController)]
+        self.bind("<Key>", self._on_key)
+        self.bind("<KeyRelease>", self._on_key_release)
+        self.loop = GameLoop(self, self._frame, self._render, lambda: FRAME)
+        self._render()
+        self.loop.start()
+
+    def _frame(self):
+        now = time.monotonic()
+        for board in self.boards:
+            if not board.engine.game_over:
+                board.step(now)
+
+    def _render(self):
+        for board in self.boards:
+            if board.dirty:
+                board.draw()
+
+    def _on_key(self, event):
+        if event.keysym == 'Escape':
+            self.destroy()
+            return
+        code = KEY_CODES.get(event.keysym, KEY_CODES.get(event.keysym.lower()))
+        if code is None:
+            return
+        for human in self.humans:
+            human.input.press(CODE_KEYS[code], time.monotonic(), getattr(event, 'time', None))
+
+    def _on_key_release(self, event):
+        code = KEY_CODES.get(event.keysym, KEY_CODES.get(event.keysym.lower()))
+        if code is None:
+            return
+        for human in self.humans:
+            human.input.release(CODE_KEYS[code], getattr(event, 'time', None))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run many Tetris boards in one window.")
+    parser.add_argument("--human", action="store_true", help="add a keyboard-controlled board first")
+    parser.add_argument("--ai", type=int, default=0, help="boards played by the AI at human-like speed")
+    parser.add_argument("--bench", type=int, default=0, help="boards where the AI places a piece every frame")
+    parser.add_argument("--seed", type=int, default=None, help="board i uses seed+i")
+    parser.add_argument("--cell", type=int, default=None, help="cell size in pixels (default: fit the screen)")
+    parser.add_argument("--columns", type=int, default=None, help="boards per row")
+    args = parser.parse_args(argv)
+    kinds = (["human"] if args.human else []) + ["ai"] * args.ai + ["bench"] * args.bench
+    if not kinds:
+        kinds = ["human", "ai"]
+    Marathon(kinds, args.seed, args.cell, args.columns).mainloop()
+
+
+if __name__ == "__main__":
+    main()
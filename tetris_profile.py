@@ -0,0 +1,130 @@
+import json
+import time
+from collections import deque
+
+SECTIONS = ("input", "gravity", "logic", "render")
+
+
+class FrameProfiler:
+    # Times named sections of work between rendered frames. Sections nest,
+    # and each one is charged only its own time, so a frame's sections add up
+    # to its total. Recent frames feed the overlay; all of them can be
+    # streamed to a JSON-lines trace file.
+    def __init__(self, window=240, trace_path=None):
+        self.frames = deque(maxlen=window)
+        self.trace = open(trace_path, "w", buffering=1 << 16) if trace_path else None
+        self._stack = []
+        self._current = dict.fromkeys(SECTIONS, 0.0)
+        self._items = 0
+
+    def section(self, name):
+        return _Section(self, name)
+
+    def wrap(self, obj, method, name):
+        # Time every call of obj.method, including calls obj makes to itself
+        func = getattr(obj, method)
+
+        def timed(*args, **kwargs):
+            with self.section(name):
+                return func(*args, **kwargs)
+        setattr(obj, method, timed)
+
+    def _enter(self, name):
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit(self):
+        name, start, children = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        self._current[name] += elapsed - children
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    def end_frame(self):
+        # Called once per rendered frame; closes the work done since the last
+        frame = {name: round(seconds * 1000, 4) for name, seconds in self._current.items()}
+        frame["total"] = round(sum(self._current.values()) * 1000, 4)
+        frame["items"] = self._items
+        self.frames.append(frame)
+        if self.trace:
+            frame = dict(frame, t=round(time.monotonic(), 6))
+            self.trace.write(json.dumps(frame, separators=(",", ":")) + "\n")
+        self._current = dict.fromkeys(SECTIONS, 0.0)
+        self._items = 0
+
+    def count_items(self, canvas):
+        # Count canvas items created during each frame
+        for method in ("create_rectangle", "create_text"):
+            create = getattr(canvas, method)
+
+            def counted(*args, _create=create, **kwargs):
+                self._items += 1
+                return _create(*args, **kwargs)
+            setattr(canvas, method, counted)
+
+    def percentiles(self, key):
+        values = sorted(frame[key] for frame in self.frames)
+        if not values:
+            return 0.0, 0.0
+        return values[len(values) // 2], values[min(len(values) - 1, int(len(values) * 0.99))]
+
+    def summary(self):
+        lines = []
+        for key in SECTIONS + ("total",):
+            p50, p99 = self.percentiles(key)
+            lines.append(f"{key:8s} p50 {p50:6.2f}  p99 {p99:6.2f} ms")
+        items = sum(frame["items"] for frame in self.frames)
+        lines.append(f"items    {items} created in last {len(self.frames)} frames")
+        return "\n".join(lines)
+
+    def close(self):
+        if self.trace:
+            self.trace.close()
+            self.trace = None
+
+
+class _Section:
+    __slots__ = ("profiler", "name")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._enter(self.name)
+
+    def __exit__(self, *exc):
+        self.profiler._exit()
+
+
+class ProfileOverlay:
+    # Text item on the board canvas showing the profiler summary, refreshed
+    # a few times a second while visible
+    def __init__(self, window, canvas, profiler, loop=None, refresh=250):
+        self.window = window
+        self.canvas = canvas
+        self.profiler = profiler
+        self.loop = loop
+        self.refresh = refresh
+        self.visible = False
+        self._handle = None
+        self.item = canvas.create_text(4, 4, anchor="nw", text="", fill="lime", font=("Courier", 8), state="hidden")
+
+    def toggle(self):
+        self.visible = not self.visible
+        if self.visible:
+            self.canvas.itemconfig(self.item, state="normal")
+            self._update()
+        else:
+            self.canvas.itemconfig(self.item, state="hidden")
+            if self._handle is not None:
+                self.window.after_cancel(self._handle)
+                self._handle = None
+
+    def _update(self):
+        text = self.profiler.summary()
+        if self.loop is not None:
+            mean, p99, worst = self.loop.jitter()
+            text += f"\njitter   mean {mean:5.2f}  p99 {p99:5.2f}  max {worst:5.2f} ms"
+        self.canvas.itemconfig(self.item, text=text)
+        self.canvas.tag_raise(self.item)
+        self._handle = self.window.after(self.refresh, self._update)
@@ -0,0 +1,104 @@
+from tetris_engine import COLS, ROWS, COLORS, ROTATIONS
+
+# Per-cell looks; None means the cell is empty and its item is hidden
+EMPTY = None
+
+
+def _block(color):
+    return (color, "grey", 1, ())
+
+
+def _ghost(color):
+    return ('', color, 2, (2, 2))
+
+
+class BoardRenderer:
+    # Retained-mode view of the main board. One rectangle per cell is created
+    # up front; each frame only the cells whose look changed are reconfigured.
+    # `origin` places the board inside a canvas shared with other boards.
+    def __init__(self, canvas, cell_size, origin=(0, 0)):
+        self.canvas = canvas
+        self.cell_size = cell_size
+        ox, oy = origin
+        self.items = []
+        for r in range(ROWS):
+            for c in range(COLS):
+                x0 = ox + c * cell_size
+                y0 = oy + r * cell_size
+                self.items.append(canvas.create_rectangle(x0, y0, x0+cell_size, y0+cell_size, state='hidden'))
+        self.looks = [EMPTY] * (ROWS * COLS)
+        font_size = max(8, cell_size * 4 // 5)
+        self.game_over_text = canvas.create_text(ox + COLS*cell_size//2, oy + ROWS*cell_size//2, text="GAME OVER", fill="red", font=("Arial", font_size, "bold"), state='hidden')
+        self.game_over_shown = False
+
+    def _frame(self, engine):
+        looks = [EMPTY] * (ROWS * COLS)
+        for r in range(ROWS):
+            if not engine.board[r]:
+                continue
+            base = r * COLS
+            for c, color in enumerate(engine.colors[r]):
+                if color:
+                    looks[base+c] = _block(color)
+        if not engine.game_over and engine.current is not None:
+            top, left = engine.current_pos
+            ghost_top = top + engine.drop_distance()
+            ghost = _ghost(engine.current_color)
+            block = _block(engine.current_color)
+            cells = engine.current_cells()
+            for r, c in cells:
+                i = (ghost_top+r) * COLS + left + c
+                if looks[i] is EMPTY:
+                    looks[i] = ghost
+            for r, c in cells:
+                looks[(top+r) * COLS + left + c] = block
+        return looks
+
+    def draw(self, engine):
+        looks = self._frame(engine)
+        canvas = self.canvas
+        old = self.looks
+        for i, look in enumerate(looks):
+            if look == old[i]:
+                continue
+            if look is EMPTY:
+                canvas.itemconfig(self.items[i], state='hidden')
+            else:
+                fill, outline, width, dash = look
+                canvas.itemconfig(self.items[i], state='normal', fill=fill, outline=outline, width=width, dash=dash)
+        self.looks = looks
+        if engine.game_over != self.game_over_shown:
+            self.game_over_shown = engine.game_over
+            canvas.itemconfig(self.game_over_text, state='normal' if engine.game_over else 'hidden')
+            canvas.tag_raise(self.game_over_text)
+
+
+class PreviewRenderer:
+    # Retained-mode view of a next/hold box: four block items and a caption,
+    # reconfigured only when the shown piece changes.
+    def __init__(self, canvas, cell_size, title, fg):
+        self.canvas = canvas
+        self.size = cell_size * 0.7
+        self.items = [canvas.create_rectangle(0, 0, 0, 0, outline="grey", state='hidden') for _ in range(4)]
+        self.caption = canvas.create_text(1.5*cell_size, 2.7*cell_size, text=title, fill=fg, font=("Arial", 9, "bold"))
+        self.shown = None
+
+    def draw(self, kind, rotation):
+        key = (kind, rotation)
+        if key == self.shown:
+            return
+        self.shown = key
+        cells = ()
+        if kind is not None:
+            state = ROTATIONS[kind][rotation]
+            x_offset = (3 - state.width) // 2
+            y_offset = (3 - state.height) // 2
+            cells = [(r + y_offset, c + x_offset) for r, c in state.cells]
+        size = self.size
+        for i, item in enumerate(self.items):
+            if i < len(cells):
+                r, c = cells[i]
+                self.canvas.coords(item, c*size, r*size, (c+1)*size, (r+1)*size)
+                self.canvas.itemconfig(item, fill=COLORS[kind], state='normal')
+            else:
+                self.canvas.itemconfig(item, state='hidden')
@@ -0,0 +1,149 @@
+import argparse
+import random
+import struct
+import time
+
+from tetris_engine import TetrisEngine, UNDO_DEPTH
+
+# Log layout: MAGIC, then 5-byte records (uint32 ms since the game started,
+# uint8 code). A NEW_GAME record is followed by the game's uint64 RNG seed,
+# so restarts and later sessions append further games to the same file.
+MAGIC = b"TRP1"
+RECORD = struct.Struct("<IB")
+SEED = struct.Struct("<Q")
+
+TICK, LEFT, RIGHT, ROTATE, DOWN, DROP, HOLD, UNDO = range(8)
+NEW_GAME = 0xFF
+KEY_CODES = {'Left': LEFT, 'Right': RIGHT, 'Up': ROTATE, 'Down': DOWN, 'space': DROP, 'c': HOLD, 'z': UNDO}
+CODE_KEYS = {code: key for key, code in KEY_CODES.items()}
+
+
+def new_seed():
+    return random.SystemRandom().randrange(2**64)
+
+
+class Recorder:
+    # Appends inputs to a replay log through a large write buffer, so
+    # recording costs a struct pack per input and no syscall
+    def __init__(self, path, buffer_size=1 << 16):
+        self.f = open(path, "ab", buffering=buffer_size)
+        if self.f.tell() == 0:
+            self.f.write(MAGIC)
+        self.start = None
+
+    def new_game(self, seed):
+        self.f.write(RECORD.pack(0, NEW_GAME) + SEED.pack(seed))
+        self.start = time.monotonic()
+
+    def record(self, code):
+        ms = int((time.monotonic() - self.start) * 1000)
+        self.f.write(RECORD.pack(ms, code))
+
+    def close(self):
+        self.f.close()
+
+
+def read_log(path):
+    # Returns [(seed, [(ms, code), ...]), ...], one entry per recorded game
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path}: not a Tetris replay log")
+    games = []
+    events = None
+    offset = len(MAGIC)
+    # A truncated tail record, e.g. from a crash mid-write, is ignored
+    while offset + RECORD.size <= len(data):
+        ms, code = RECORD.unpack_from(data, offset)
+        offset += RECORD.size
+        if code == NEW_GAME:
+            if offset + SEED.size > len(data):
+                break
+            events = []
+            games.append((SEED.unpack_from(data, offset)[0], events))
+            offset += SEED.size
+        elif events is not None:
+            events.append((ms, code))
+    return games
+
+
+def apply(engine, code):
+    if code == TICK:
+        engine.tick()
+    elif code == LEFT:
+        engine.move(-1)
+    elif code == RIGHT:
+        engine.move(1)
+    elif code == ROTATE:
+        engine.rotate()
+    elif code == DOWN:
+        engine.step_down()
+    elif code == DROP:
+        engine.hard_drop()
+    elif code == HOLD:
+        engine.hold()
+    elif code == UNDO:
+        engine.undo()
+
+
+def fast_forward(seed, events):
+    # Re-run a game with no display at full speed and return the engine
+    engine = TetrisEngine(rng=random.Random(seed), history=UNDO_DEPTH)
+    for _, code in events:
+        if engine.game_over:
+            break
+        apply(engine, code)
+    return engine
+
+
+class WindowPlayer:
+    # Plays a recorded game into a Tetris window at the recorded pace
+    def __init__(self, window, events):
+        self.window = window
+        self.events = events
+        self.index = 0
+        self.start = time.monotonic()
+
+    def start_playback(self):
+        self._schedule()
+
+    def _schedule(self):
+        if self.index >= len(self.events):
+            return
+        ms = self.events[self.index][0]
+        elapsed = (time.monotonic() - self.start) * 1000
+        self.window.after(max(0, int(ms - elapsed)), self._step)
+
+    def _step(self):
+        # Apply every input that is due, then wait for the next one
+        now = (time.monotonic() - self.start) * 1000
+        while self.index < len(self.events) and self.events[self.index][0] <= now:
+            self.window._replay_input(self.events[self.index][1])
+            self.index += 1
+        self._schedule()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded Tetris log.")
+    parser.add_argument("log")
+    parser.add_argument("--game", type=int, default=None, help="index of the game to replay (default: all)")
+    parser.add_argument("--realtime", action="store_true", help="play in a window at recorded speed")
+    args = parser.parse_args(argv)
+
+    games = read_log(args.log)
+    if args.game is not None:
+        games = [games[args.game]]
+    if args.realtime:
+        from tetris_window import Tetris
+        seed, events = games[0]
+        window = Tetris(seed=seed, gravity=False, record_scores=False)
+        WindowPlayer(window, events).start_playback()
+        window.mainloop()
+        return
+    for i, (seed, events) in enumerate(games):
+        engine = fast_forward(seed, events)
+        print(f"game {i}: seed={seed} inputs={len(events)} score={engine.score} lines={engine.lines_cleared} level={engine.level}")
+
+
+if __name__ == "__main__":
+    main()
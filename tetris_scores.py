@@ -0,0 +1,132 @@
+import json
+import os
+import tempfile
+import threading
+import time
+
+SCORES_FILE = "tetris_scores.json"
+LEGACY_FILE = "tetris_highscore.txt"
+
+
+class Leaderboard:
+    # Top scores kept in memory and written by a background thread. Changes
+    # are coalesced and written at most once per interval, or right away on
+    # flush(), always through a temp file and rename so a crash mid-write
+    # leaves the previous file intact. Nothing is read until first use.
+    def __init__(self, path=SCORES_FILE, legacy_path=LEGACY_FILE, max_entries=10, interval=5.0):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.max_entries = max_entries
+        self.interval = interval
+        self._entries = None
+        # game key -> that game's entry, so a game in progress keeps one
+        # provisional entry that is updated rather than added again
+        self._games = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._wake = threading.Event()
+        self._flushed = threading.Event()
+        self._flushed.set()
+        self._closing = False
+        self._thread = threading.Thread(target=self._run, name="tetris-scores", daemon=True)
+        self._thread.start()
+
+    @property
+    def entries(self):
+        with self._lock:
+            return list(self._loaded())
+
+    def _loaded(self):
+        # Call with the lock held
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    def high_score(self):
+        entries = self.entries
+        return entries[0]["score"] if entries else 0
+
+    def add(self, name, score, lines, level, game=None):
+        # Returns the 1-based rank, or None if the score didn't make the table.
+        # With a game key, replaces that game's earlier entry; written on the
+        # next interval like any other change.
+        entry = {"name": name, "score": score, "lines": lines, "level": level,
+                 "date": time.strftime("%Y-%m-%d %H:%M:%S")}
+        with self._lock:
+            entries = self._loaded()
+            if game is not None:
+                old = self._games.pop(game, None)
+                for i, e in enumerate(entries):
+                    if e is old:
+                        del entries[i]
+                        self._dirty = True
+                        self._flushed.clear()
+                        break
+                if score <= 0:
+                    return None
+            rank = next((i for i, e in enumerate(entries) if score > e["score"]), len(entries))
+            if rank >= self.max_entries:
+                return None
+            entries.insert(rank, entry)
+            del entries[self.max_entries:]
+            if game is not None:
+                self._games[game] = entry
+            self._dirty = True
+            self._flushed.clear()
+        return rank + 1
+
+    def flush(self, wait=False):
+        # Write pending changes now instead of at the next interval
+        self._wake.set()
+        if wait:
+            self._flushed.wait(timeout=5)
+
+    def close(self):
+        self._closing = True
+        self._wake.set()
+        self._thread.join(timeout=5)
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)[:self.max_entries]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            return []
+        # First run after the single high score file: carry it over
+        try:
+            with open(self.legacy_path, "r") as f:
+                score = int(f.read())
+        except Exception:
+            return []
+        return [{"name": "", "score": score, "lines": 0, "level": 0, "date": ""}] if score > 0 else []
+
+    def _run(self):
+        while True:
+            self._wake.wait(timeout=self.interval)
+            self._wake.clear()
+            with self._lock:
+                snapshot = list(self._entries) if self._dirty else None
+                self._dirty = False
+            if snapshot is not None:
+                self._write(snapshot)
+            with self._lock:
+                if not self._dirty:
+                    self._flushed.set()
+            if self._closing:
+                return
+
+    def _write(self, entries):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        tmp = None
+        try:
+            fd, tmp = tempfile.mkstemp(prefix=".tetris_scores.", dir=directory)
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f, indent=1)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except OSError:
+            if tmp is not None and os.path.exists(tmp):
+                os.unlink(tmp)
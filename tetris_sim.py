@@ -0,0 +1,116 @@
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+from multiprocessing import Pool
+
+from tetris_engine import TetrisEngine, COLS, ROTATIONS
+
+FIELDS = ["seed", "score", "lines", "level", "pieces"]
+
+
+def random_policy(engine, rng):
+    # Drop each piece with a random rotation at a random column
+    for _ in range(rng.randint(0, 3)):
+        engine.rotate()
+    width = ROTATIONS[engine.current][engine.rotation].width
+    target = rng.randint(0, COLS - width)
+    step = 1 if target > engine.current_pos[1] else -1
+    while engine.current_pos[1] != target and engine.move(step):
+        pass
+    engine.hard_drop()
+
+
+def ai_policy(engine, rng):
+    # Imported here so the random policy works without NumPy
+    import tetris_ai
+    tetris_ai.play_move(engine)
+
+
+POLICIES = {
+    "random": random_policy,
+    "ai": ai_policy,
+}
+
+
+def play_game(seed, policy="random", max_pieces=10000):
+    # One headless game; the piece sequence depends only on the seed
+    engine = TetrisEngine(rng=random.Random(seed))
+    rng = random.Random(f"policy-{seed}")
+    place = POLICIES[policy]
+    while not engine.game_over and engine.pieces_placed < max_pieces:
+        place(engine, rng)
+    return {
+        "seed": seed,
+        "score": engine.score,
+        "lines": engine.lines_cleared,
+        "level": engine.level,
+        "pieces": engine.pieces_placed,
+    }
+
+
+def _play_args(args):
+    return play_game(*args)
+
+
+def run_games(seeds, policy="random", max_pieces=10000, workers=None, chunksize=None):
+    # Yields results as games finish, not in seed order
+    jobs = [(seed, policy, max_pieces) for seed in seeds]
+    if workers == 1:
+        for job in jobs:
+            yield _play_args(job)
+        return
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        # A few chunks per worker keeps all cores busy without per-game IPC
+        chunksize = max(1, len(jobs) // (workers * 4))
+    with Pool(workers) as pool:
+        yield from pool.imap_unordered(_play_args, jobs, chunksize)
+
+
+class ResultWriter:
+    def __init__(self, f, fmt):
+        self.f = f
+        self.fmt = fmt
+        if fmt == "csv":
+            self.writer = csv.DictWriter(f, fieldnames=FIELDS)
+            self.writer.writeheader()
+
+    def write(self, result):
+        if self.fmt == "csv":
+            self.writer.writerow(result)
+        else:
+            self.f.write(json.dumps(result, separators=(",", ":")) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play Tetris games headlessly across a process pool.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game; game i uses seed+i")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use (default: all cores)")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--max-pieces", type=int, default=10000, help="stop a game after this many pieces")
+    parser.add_argument("--out", default="-", help="output file, '-' for stdout")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default=None, help="default: from --out extension, else csv")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("jsonl" if args.out.endswith(".jsonl") else "csv")
+    f = sys.stdout if args.out == "-" else open(args.out, "w", newline="")
+    start = time.perf_counter()
+    try:
+        writer = ResultWriter(f, fmt)
+        seeds = range(args.seed, args.seed + args.games)
+        for result in run_games(seeds, args.policy, args.max_pieces, args.workers):
+            writer.write(result)
+    finally:
+        if f is not sys.stdout:
+            f.close()
+    elapsed = time.perf_counter() - start
+    print(f"{args.games} games in {elapsed:.2f}s ({args.games / elapsed:.0f} games/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+import tkinter as tk
+import random
+import time
+
+from tetris_engine import TetrisEngine, Snapshot, COLS, ROWS, UNDO_DEPTH, SAVE_FILE
+from tetris_render import BoardRenderer, PreviewRenderer
+from tetris_input import InputState, DAS, ARR
+from tetris_loop import GameLoop
+from tetris_profile import FrameProfiler, ProfileOverlay
+from tetris_scores import Leaderboard
+from tetris_replay import KEY_CODES, CODE_KEYS, TICK, Recorder, new_seed
+
+CELL_SIZE = 30
+FRAME = 1 / 60  # seconds per logic frame
+AI_DELAY = 60  # ms between autoplay key presses
+
+class Tetris(tk.Tk):
+    def __init__(self, seed=None, record=None, gravity=True, sound=True, player_name="", trace=None, das=DAS, arr=ARR, resume=None, record_scores=True):
+        super().__init__()
+        self.title("Tetris")
+        self.resizable(False, False)
+        self.theme = 'dark'
+        self.bg_colors = {'dark': 'black', 'light': '#f0f0f0'}
+        self.fg_colors = {'dark': 'white', 'light': 'black'}
+        self.canvas = tk.Canvas(self, width=COLS*CELL_SIZE, height=ROWS*CELL_SIZE, bg=self.bg_colors[self.theme])
+        self.canvas.pack(side=tk.LEFT)
+        # Next piece preview (smaller, closer)
+        self.preview_canvas = tk.Canvas(self, width=3*CELL_SIZE, height=3*CELL_SIZE, bg=self.bg_colors[self.theme], highlightthickness=2, highlightbackground='gray')
+        self.preview_canvas.place(x=COLS*CELL_SIZE-3*CELL_SIZE-10, y=10)
+        # Hold piece preview
+        self.hold_canvas = tk.Canvas(self, width=3*CELL_SIZE, height=3*CELL_SIZE, bg=self.bg_colors[self.theme], highlightthickness=2, highlightbackground='gray')
+        self.hold_canvas.place(x=10, y=10)
+        self.player_name = player_name
+        # Replays show a recorded game and must not store it again
+        self.record_scores = record_scores
+        self.scores = Leaderboard()
+        # Filled in once the window is up so startup never waits on disk
+        self.high_score = 0
+        # Sound backends are probed only once a window exists
+        from tetris_audio import AudioPlayer, NullBackend
+        self.audio = AudioPlayer() if sound else AudioPlayer(NullBackend())
+        self.soft_drop = False
+        # Held keys are applied once per frame by the game loop
+        self.input = InputState(das, arr)
+        self.gravity_clock = 0.0
+        self.dirty = True
+        self.sounds = []
+        self.autoplay = False
+        self.ai_plan = []
+        # (seed, pieces placed, hold used) the plan was made for
+        self.ai_plan_for = None
+        # Seeded per game so a recorded log can be replayed exactly
+        self.seed = new_seed() if seed is None else seed
+        # Leaderboard key of the game in progress
+        self.game_key = object()
+        self.recorder = Recorder(record) if record else None
+        if self.recorder:
+            self.recorder.new_game(self.seed)
+        self.engine = TetrisEngine(rng=random.Random(self.seed), on_event=self._on_engine_event, history=UNDO_DEPTH)
+        if resume:
+            with open(resume, "rb") as f:
+                self.engine.restore(Snapshot.from_bytes(f.read()))
+        # Frame timings, shown with F3; --trace also writes them to a file
+        self.profiler = FrameProfiler(trace_path=trace)
+        self.profiler.wrap(self.engine, 'lock', 'logic')
+        for canvas in (self.canvas, self.preview_canvas, self.hold_canvas):
+            self.profiler.count_items(canvas)
+        self.board_renderer = BoardRenderer(self.canvas, CELL_SIZE)
+        self.preview_renderer = PreviewRenderer(self.preview_canvas, CELL_SIZE, "Next", self.fg_colors[self.theme])
+        self.hold_renderer = PreviewRenderer(self.hold_canvas, CELL_SIZE, "Hold", self.fg_colors[self.theme])
+        self._draw_board()
+        self._draw_preview()
+        self.bind("<Key>", self._on_key)
+        self.bind("<KeyRelease>", self._on_key_release)
+        # Input and gravity run on a fixed-timestep loop; replays feed
+        # recorded inputs instead
+        self.gravity = gravity
+        self.loop = GameLoop(self, self._frame, self._render, lambda: FRAME)
+        self.overlay = ProfileOverlay(self, self.canvas, self.profiler, self.loop)
+        if gravity:
+            self.loop.start()
+        self.score_label = tk.Label(self, text=f"Score: {self.engine.score}", font=("Arial", 14), bg=self.bg_colors[self.theme], fg=self.fg_colors[self.theme])
+        self.score_label.pack(fill=tk.X)
+        self.level_label = tk.Label(self, text=f"Level: {self.engine.level}", font=("Arial", 12), bg=self.bg_colors[self.theme], fg="#00adb5")
+        self.level_label.pack(fill=tk.X)
+        self.lines_label = tk.Label(self, text=f"Lines: {self.engine.lines_cleared}", font=("Arial", 12), bg=self.bg_colors[self.theme], fg="#00adb5")
+        self.lines_label.pack(fill=tk.X)
+        self.high_score_label = tk.Label(self, text="High Score: -", font=("Arial", 14), bg=self.bg_colors[self.theme], fg="gold")
+        self.high_score_label.pack(fill=tk.X)
+        self.after_idle(self._show_high_score)
+        btn_frame = tk.Frame(self, bg=self.bg_colors[self.theme])
+        btn_frame.pack(pady=5)
+        self.restart_btn = tk.Button(btn_frame, text="⟳ Restart", font=("Arial", 12, "bold"), bg="#222", fg="white", command=self._restart, relief=tk.RAISED, width=10)
+        self.restart_btn.pack(side=tk.LEFT, padx=5)
+        self.pause_btn = tk.Button(btn_frame, text="⏸ Pause", font=("Arial", 12, "bold"), bg="#444", fg="white", command=self._toggle_pause, relief=tk.RAISED, width=10)
+        self.pause_btn.pack(side=tk.LEFT, padx=5)
+
+    def _get_speed(self):
+        return self.engine.speed()
+
+    def _play_sound(self, event):
+        # Queued until the end of the frame, at most once per kind
+        if event not in self.sounds:
+            self.sounds.append(event)
+
+    def _flush_sounds(self):
+        for event in self.sounds:
+            self.audio.play(event)
+        self.sounds = []
+
+    def _show_high_score(self):
+        self.high_score = max(self.high_score, self.scores.high_score())
+        self.high_score_label.config(text=f"High Score: {self.high_score}")
+
+    def _on_engine_event(self, event):
+        if event == 'line':
+            self._play_sound('line')
+        elif event == 'lock':
+            self._update_labels()
+        elif event == 'gameover':
+            self.loop.stop()
+            # The loop won't render again; show the final board
+            self.dirty = True
+            self.after_idle(self._render)
+            self._play_sound('gameover')
+            engine = self.engine
+            if self.record_scores and engine.score > 0:
+                self.scores.add(self.player_name, engine.score, engine.lines_cleared, engine.level, self.game_key)
+                self.scores.flush()
+
+    def _update_labels(self):
+        engine = self.engine
+        self.score_label.config(text=f"Score: {engine.score}")
+        self.level_label.config(text=f"Level: {engine.level}")
+        self.lines_label.config(text=f"Lines: {engine.lines_cleared}")
+        if engine.score > self.high_score:
+            self.high_score = engine.score
+            self.high_score_label.config(text=f"High Score: {self.high_score}")
+        # The game in progress keeps a provisional entry, written at most
+        # every few seconds, so quitting mid-game doesn't lose a record
+        if self.record_scores and not engine.game_over:
+            self.scores.add(self.player_name, engine.score, engine.lines_cleared, engine.level, self.game_key)
+
+    def _restart(self):
+        self.seed = new_seed()
+        self.game_key = object()
+        if self.recorder:
+            self.recorder.new_game(self.seed)
+        self.engine.rng = random.Random(self.seed)
+        self.engine.reset()
+        self.input.clear()
+        self.ai_plan = []
+        self.gravity_clock = 0.0
+        self._update_labels()
+        self.dirty = True
+        self._render()
+        if self.gravity:
+            self.loop.start()
+            self._set_pause_button(False)
+
+    def _draw_preview(self):
+        engine = self.engine
+        with self.profiler.section('render'):
+            self.preview_renderer.draw(engine.next_piece, 0)
+            self.hold_renderer.draw(engine.hold_piece, engine.hold_rotation)
+
+    def _draw_board(self):
+        with self.profiler.section('render'):
+            self.board_renderer.draw(self.engine)
+
+    def _render(self):
+        self._flush_sounds()
+        if not self.dirty:
+            return
+        self.dirty = False
+        self._draw_board()
+        self._draw_preview()
+        self.profiler.end_frame()
+
+    def _frame(self):
+        # One logic frame: apply held and pressed keys, then gravity
+        with self.profiler.section('input'):
+            for key in self.input.poll(time.monotonic()):
+                self._apply_key(key)
+        self.soft_drop = self.input.is_held('Down')
+        self.gravity_clock += FRAME
+        interval = self._tick_interval()
+        while self.gravity_clock >= interval and not self.engine.game_over:
+            self.gravity_clock -= interval
+            self._tick()
+        if self.engine.game_over:
+            self.gravity_clock = 0.0
+
+    def _tick_interval(self):
+        if self.soft_drop:
+            return 0.03  # Fast drop when down arrow held
+        return self._get_speed() / 1000
+
+    def _tick(self):
+        # One gravity step; drawing is left to the loop's render callback
+        if self.engine.game_over:
+            return
+        with self.profiler.section('gravity'):
+            self._record(TICK)
+            self.engine.tick()
+        self.dirty = True
+
+    def _record(self, code):
+        if self.recorder:
+            self.recorder.record(code)
+
+    def _replay_input(self, code):
+        if code == TICK:
+            self._tick()
+        else:
+            self._apply_key(CODE_KEYS[code])
+        self._render()
+
+    def _on_key(self, event):
+        # Only records key state; moves happen in the next logic frame
+        key = event.keysym
+        if key == 'F3':
+            self.overlay.toggle()
+        elif key == 'F5':
+            self._save_game()
+        elif key.lower() == 'a':
+            self._toggle_autoplay()
+        elif not self.engine.game_over and not self.loop.paused:
+            code = KEY_CODES.get(key, KEY_CODES.get(key.lower()))
+            if code is not None:
+                self.input.press(CODE_KEYS[code], time.monotonic(), getattr(event, 'time', None))
+
+    def _apply_key(self, key):
+        engine = self.engine
+        if engine.game_over:
+            return
+        code = KEY_CODES.get(key)
+        if code is None:
+            return
+        self._record(code)
+        self.dirty = True
+        if key == 'Left':
+            if engine.move(-1):
+                self._play_sound('move')
+        elif key == 'Right':
+            if engine.move(1):
+                self._play_sound('move')
+        elif key == 'Down':
+            if engine.step_down():
+                self._play_sound('move')
+        elif key == 'Up':
+            if engine.rotate():
+                self._play_sound('rotate')
+        elif key == 'space':
+            # Hard drop
+            self._play_sound('drop')
+            engine.hard_drop()
+        elif key == 'c':
+            # Hold piece
+            engine.hold()
+        elif key == 'z':
+            if engine.undo():
+                self._update_labels()
+
+    def _on_key_release(self, event):
+        code = KEY_CODES.get(event.keysym, KEY_CODES.get(event.keysym.lower()))
+        if code is not None:
+            self.input.release(CODE_KEYS[code], getattr(event, 'time', None))
+
+    def _save_game(self):
+        # Resume later with --resume
+        try:
+            with open(SAVE_FILE, "wb") as f:
+                f.write(self.engine.snapshot().to_bytes())
+        except OSError:
+            pass
+
+    # Autoplay: the AI plays by sending the same key presses a player would
+    def _toggle_autoplay(self):
+        self.autoplay = not self.autoplay
+        self.ai_plan = []
+        if self.autoplay:
+            self.after(AI_DELAY, self._ai_step)
+
+    def _ai_step(self):
+        if not self.autoplay or self.engine.game_over:
+            self.autoplay = False
+            return
+        import tetris_ai
+        # Gravity can lock the piece mid-plan, and restart, hold or undo can
+        # swap it; leftover keys must not steer a different piece
+        piece = (self.seed, self.engine.pieces_placed, self.engine.hold_used)
+        if piece != self.ai_plan_for:
+            self.ai_plan = []
+            self.ai_plan_for = piece
+        if not self.ai_plan:
+            move = tetris_ai.best_move(self.engine)
+            self.ai_plan = tetris_ai.plan_keys(self.engine, move) if move else ['space']
+        if not self.loop.paused:
+            self._apply_key(self.ai_plan.pop(0))
+        self.after(AI_DELAY, self._ai_step)
+
+    # Pause/Resume
+    def _toggle_pause(self):
+        if self.loop.paused:
+            self.loop.resume()
+        else:
+            self.loop.pause()
+            self.input.clear()
+        self._set_pause_button(self.loop.paused)
+
+    def _set_pause_button(self, paused):
+        if paused:
+            self.pause_btn.config(text="▶ Resume", bg="#0a0")
+        else:
+            self.pause_btn.config(text="⏸ Pause", bg="#444")